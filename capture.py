@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import threading
 from typing import Callable, TYPE_CHECKING
 
 import mss
@@ -16,6 +17,14 @@ if TYPE_CHECKING:
 
 log = get_logger("capture")
 
+# Brightness of the unselected overlay area (1 - 120/255 black overlay)
+_DIM_OPACITY = 0.53
+
+# Extra area _draw_highlight() paints around a rect: the 2px border, and the
+# size label above it (or below, near the top edge) at least this wide
+_HIGHLIGHT_MARGIN = 30
+_LABEL_WIDTH = 200
+
 
 class CaptureOverlay(QWidget):
   """Fullscreen overlay for region or window capture."""
@@ -44,9 +53,9 @@ class CaptureOverlay(QWidget):
     # Window mode state
     self.highlight_rect = None
     self._overlay_hwnd = 0
+    self._window_rects = None  # Snapshot taken on the first mouse move
 
     self.screenshot_qimage = None
-    self.dimmed_pixmap = None
     self.screenshot_pixmap = None
 
   def start(self) -> None:
@@ -59,7 +68,7 @@ class CaptureOverlay(QWidget):
         self.on_done(None, error=f"Screenshot failed: {e}")
       return
 
-    self._prepare_dimmed()
+    self._prepare_pixmap()
 
     self.setWindowFlags(
       Qt.WindowType.FramelessWindowHint
@@ -86,19 +95,20 @@ class CaptureOverlay(QWidget):
     with mss.mss() as sct:
       monitor = sct.monitors[0]
       raw = sct.grab(monitor)
+      # Wrap mss's raw buffer directly (raw.bgra would be an extra W*H*4 copy)
+      # and take one owning copy. All later pixel access goes through const
+      # QImage APIs, so clipboard/save/crop share this buffer without detaching.
+      # BGRx maps to RGB32 (0xffRRGGBB): same layout as ARGB32, but Qt skips
+      # alpha blending when drawing and alpha handling when encoding.
       self.screenshot_qimage = QImage(
-        bytes(raw.bgra), raw.width, raw.height, QImage.Format.Format_ARGB32,
+        raw.raw, raw.width, raw.height, QImage.Format.Format_RGB32,
       ).copy()
       self.screen_left = monitor["left"]
       self.screen_top = monitor["top"]
 
-  def _prepare_dimmed(self) -> None:
-    """Create a dimmed version of the screenshot for the overlay background."""
+  def _prepare_pixmap(self) -> None:
+    """Convert the screenshot to a pixmap for the overlay background."""
     self.screenshot_pixmap = QPixmap.fromImage(self.screenshot_qimage)
-    self.dimmed_pixmap = self.screenshot_pixmap.copy()
-    painter = QPainter(self.dimmed_pixmap)
-    painter.fillRect(self.dimmed_pixmap.rect(), QColor(0, 0, 0, 120))
-    painter.end()
 
   # -- Rendering --------------------------------------------------------
 
@@ -118,9 +128,31 @@ class CaptureOverlay(QWidget):
     label_y = rect.top() - 8 if rect.top() > 25 else rect.bottom() + 18
     painter.drawText(rect.left(), label_y, label)
 
+  def _highlight_bounds(self, rect: QRect | None) -> QRect:
+    """Area _draw_highlight() may touch for rect (null rect for no highlight)."""
+    if rect is None or rect.isEmpty():
+      return QRect()
+    bounds = rect.adjusted(-2, -_HIGHLIGHT_MARGIN, 2, _HIGHLIGHT_MARGIN)
+    if bounds.width() < _LABEL_WIDTH:
+      bounds.setWidth(_LABEL_WIDTH)
+    return bounds
+
+  def _update_highlight(self, old: QRect | None, new: QRect | None) -> None:
+    """Schedule a repaint of just the area a highlight moved out of and into."""
+    self.update(self._highlight_bounds(old).united(self._highlight_bounds(new)))
+
   def paintEvent(self, event: QPaintEvent) -> None:
     painter = QPainter(self)
-    painter.drawPixmap(0, 0, self.dimmed_pixmap)
+    # Mouse moves only invalidate the old + new highlight area; clip to it so
+    # the dim blend below doesn't redo the whole screen every frame
+    painter.setClipRect(event.rect())
+    # Dim by drawing the one screenshot pixmap at reduced opacity over black
+    # (same result as a 120-alpha black fill) instead of keeping a second,
+    # pre-darkened full-screen copy alive.
+    painter.fillRect(self.rect(), Qt.GlobalColor.black)
+    painter.setOpacity(_DIM_OPACITY)
+    painter.drawPixmap(0, 0, self.screenshot_pixmap)
+    painter.setOpacity(1.0)
 
     # Region mode: drag selection
     if self.is_selecting:
@@ -152,8 +184,9 @@ class CaptureOverlay(QWidget):
     if self.mode == "window":
       self._update_window_highlight(event.position().toPoint())
     elif self.is_selecting:
+      old = QRect(self.start_pos, self.current_pos).normalized()
       self.current_pos = event.position().toPoint()
-      self.update()
+      self._update_highlight(old, QRect(self.start_pos, self.current_pos).normalized())
 
   def mouseReleaseEvent(self, event: QMouseEvent) -> None:
     if event.button() == Qt.MouseButton.LeftButton and self.is_selecting:
@@ -162,8 +195,7 @@ class CaptureOverlay(QWidget):
       if rect.width() < 3 or rect.height() < 3:
         self._cancel()
         return
-      cropped = self.screenshot_qimage.copy(rect)
-      self._finish_capture(cropped)
+      self._finish_capture(self._crop(rect))
 
   # -- Keyboard events --------------------------------------------------
 
@@ -177,14 +209,20 @@ class CaptureOverlay(QWidget):
 
   def _update_window_highlight(self, pos: QPoint) -> None:
     """Detect the window under the cursor and highlight it."""
-    from window_utils import get_cursor_pos, get_window_rect_at
+    from window_utils import get_cursor_pos, get_window_rects, window_rect_at
+
+    # The overlay shows a frozen screenshot, so enumerate the windows once
+    # and hit-test that snapshot on every move instead of re-walking the
+    # Z-order through EnumWindows each time.
+    if self._window_rects is None:
+      self._window_rects = get_window_rects(self._overlay_hwnd)
 
     # Use Win32 GetCursorPos for physical screen coordinates
     # (matches coordinate space of window rects from EnumWindows,
     # avoids logical vs physical pixel mismatch on high-DPI displays)
     screen_x, screen_y = get_cursor_pos()
 
-    result = get_window_rect_at(screen_x, screen_y, self._overlay_hwnd)
+    result = window_rect_at(self._window_rects, screen_x, screen_y)
     if result:
       left, top, right, bottom = result
       local_rect = QRect(
@@ -198,17 +236,16 @@ class CaptureOverlay(QWidget):
         QRect(0, 0, self.screenshot_qimage.width(), self.screenshot_qimage.height())
       )
       if local_rect != self.highlight_rect:
+        self._update_highlight(self.highlight_rect, local_rect)
         self.highlight_rect = local_rect
-        self.update()
     elif self.highlight_rect is not None:
+      self._update_highlight(self.highlight_rect, None)
       self.highlight_rect = None
-      self.update()
 
   def _capture_window(self) -> None:
     """Capture the currently highlighted window."""
     if self.highlight_rect and self.highlight_rect.width() > 2 and self.highlight_rect.height() > 2:
-      cropped = self.screenshot_qimage.copy(self.highlight_rect)
-      self._finish_capture(cropped)
+      self._finish_capture(self._crop(self.highlight_rect))
     else:
       self._cancel()
 
@@ -222,8 +259,7 @@ class CaptureOverlay(QWidget):
       self.on_image_ready(qimage)
       return
 
-    clipboard_ok = copy_image_to_clipboard(qimage)
-    filepath = self._save(qimage) if self.save_to_disk else None
+    clipboard_ok, filepath = self._copy_and_save(qimage)
     self.close()
 
     if not clipboard_ok and not filepath:
@@ -239,10 +275,46 @@ class CaptureOverlay(QWidget):
     if self.on_done:
       self.on_done(filepath, error=error)
 
+  def _crop(self, rect: QRect) -> QImage:
+    """Return the selected region of the screenshot.
+
+    A selection covering the whole screenshot (maximized window, full-screen
+    drag) shares the existing buffer instead of copying it. Partial regions
+    still go through QImage.copy(), which gives the crop its own buffer so
+    it stays valid after the overlay (and its screenshot) is deleted.
+    """
+    rect = rect.intersected(self.screenshot_qimage.rect())
+    if rect == self.screenshot_qimage.rect():
+      return self.screenshot_qimage
+    return self.screenshot_qimage.copy(rect)
+
   def _capture_fullscreen(self) -> None:
     """Capture the entire screen from the overlay."""
     self._finish_capture(self.screenshot_qimage)
 
+  def _copy_and_save(self, qimage: QImage) -> tuple[bool, str | None]:
+    """Copy to clipboard while the disk save runs on a worker thread.
+
+    The clipboard is what the user is waiting on, so the encode + write
+    overlaps it and is joined afterwards. The worker gets its own QImage
+    handle (implicitly shared, no pixel copy) and never touches widgets.
+    """
+    saved: list[str | None] = [None]
+    saver = None
+    if self.save_to_disk:
+      image = QImage(qimage)
+
+      def _run() -> None:
+        saved[0] = self._save(image)
+
+      saver = threading.Thread(target=_run, name="capture-save", daemon=True)
+      saver.start()
+
+    clipboard_ok = copy_image_to_clipboard(qimage)
+    if saver is not None:
+      saver.join()
+    return clipboard_ok, saved[0]
+
   def _save(self, qimage: QImage) -> str | None:
     return save_qimage(qimage, self.save_folder, self.fmt, self.filename_prefix,
                        self.filename_suffix)
@@ -269,8 +341,7 @@ class CaptureOverlay(QWidget):
       self.on_image_ready(self.screenshot_qimage)
       return
 
-    clipboard_ok = copy_image_to_clipboard(self.screenshot_qimage)
-    filepath = self._save(self.screenshot_qimage) if self.save_to_disk else None
+    clipboard_ok, filepath = self._copy_and_save(self.screenshot_qimage)
 
     if not clipboard_ok and not filepath:
       if self.save_to_disk:
@@ -0,0 +1,27 @@
+"""Shared pytest fixtures."""
+
+import os
+import tempfile
+
+# Send the rotating log to a temp dir instead of the repo root; must happen
+# before anything imports log (main, capture, ...)
+os.environ.setdefault("IMMEDIPASTE_LOG_DIR", tempfile.mkdtemp(prefix="immedipaste-test-log-"))
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+import main
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapp():
+  """One QApplication for the whole session (widgets, clipboard, image I/O)."""
+  return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+  """Redirect config I/O to a temp directory."""
+  path = tmp_path / "config.json"
+  monkeypatch.setattr(main, "CONFIG_PATH", str(path))
+  return path
@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import queue
 import sys
 import tempfile
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 LOG_FILENAME = "immedipaste.log"
+# Overrides the log directory (used by the test suite to keep logs out of
+# the source tree)
+LOG_DIR_ENV = "IMMEDIPASTE_LOG_DIR"
 
 
 def _resolve_log_dir() -> str:
   """Pick a writable directory for the log file.
 
-  Priority: app dir (next to exe) > %APPDATA%/ImmediPaste > temp dir.
+  Priority: $IMMEDIPASTE_LOG_DIR > app dir (next to exe) >
+  %APPDATA%/ImmediPaste > temp dir.
   """
+  override = os.environ.get(LOG_DIR_ENV)
+  if override:
+    try:
+      os.makedirs(override, exist_ok=True)
+      return override
+    except OSError:
+      pass
+
   if getattr(sys, "frozen", False):
     app_dir = os.path.dirname(sys.executable)
   else:
@@ -74,14 +88,25 @@ except OSError:
 _console_handler = logging.StreamHandler()
 _console_handler.setFormatter(_formatter)
 
+# Loggers only enqueue records; the file/console writes (and rotation) run on
+# the listener's background thread so they never block the Qt main thread.
+# atexit stops the listener, which drains anything still queued.
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_queue)
+_listener = QueueListener(
+  _queue,
+  *[h for h in (_file_handler, _console_handler) if h],
+  respect_handler_level=True,
+)
+_listener.start()
+atexit.register(_listener.stop)
+
 
 def get_logger(name: str) -> logging.Logger:
-  """Get a named logger with file and console handlers."""
+  """Get a named logger that feeds the shared file and console handlers."""
   logger = logging.getLogger(f"immedipaste.{name}")
   if not logger.handlers:
     logger.setLevel(logging.DEBUG)
     logger.propagate = False
-    if _file_handler:
-      logger.addHandler(_file_handler)
-    logger.addHandler(_console_handler)
+    logger.addHandler(_queue_handler)
   return logger
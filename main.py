@@ -1,25 +1,42 @@
 from __future__ import annotations
 
+import collections
 import functools
 import json
 import os
-import platform
-import subprocess
 import sys
-from typing import Any, Callable, IO
+import tempfile
+import threading
+import time
+import types
+from typing import Any, Callable, IO, TYPE_CHECKING
+
+if sys.platform == "win32":
+  import msvcrt
+  import winreg
+else:
+  import fcntl
 
 from PySide6.QtCore import Qt, QObject, Signal, QTimer
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor
+from PySide6.QtGui import QAction, QIcon, QPixmap, QPainter, QColor
 from PySide6.QtWidgets import (
   QApplication, QSystemTrayIcon, QMenu, QDialog, QFormLayout,
   QLineEdit, QComboBox, QCheckBox, QPushButton, QHBoxLayout,
   QVBoxLayout, QLabel, QFileDialog, QWidget,
 )
-from pynput import keyboard
 
-from capture import CaptureOverlay
 from log import get_logger
-from platform_utils import default_save_folder
+from platform_utils import (
+  IS_MACOS, IS_WINDOWS, NativeHotkeyListener, default_save_folder, parse_native_hotkey,
+  select_in_explorer,
+)
+
+# capture (mss), annotation_editor and pynput are imported where first used:
+# none is needed to get the tray icon up, the editor only loads when
+# annotation mode is on, and pynput never loads when native hotkeys work
+if TYPE_CHECKING:
+  from annotation_editor import AnnotationEditor
+  from capture import CaptureOverlay
 
 log = get_logger("main")
 
@@ -31,11 +48,13 @@ if getattr(sys, "frozen", False):
 else:
   APP_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(APP_DIR, "config.json")
+_CONFIG_IO_BUFFER = 64 * 1024
 
 
 CONFIG_VERSION = 5
 
-DEFAULT_CONFIG = {
+# Read-only: shared by every load/migrate, callers copy it with dict()
+DEFAULT_CONFIG = types.MappingProxyType({
   "config_version": CONFIG_VERSION,
   "save_folder": default_save_folder(),
   "hotkey_region": "<ctrl>+<alt>+<shift>+s",
@@ -51,7 +70,7 @@ DEFAULT_CONFIG = {
   "annotate_shift_tool": "arrow",
   "annotate_ctrl_tool": "oval",
   "annotate_alt_tool": "text",
-}
+})
 
 STARTUP_REG_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
 STARTUP_REG_NAME = "ImmediPaste"
@@ -61,7 +80,6 @@ def set_launch_on_startup(enabled: bool) -> None:
   """Add or remove ImmediPaste from the Windows startup registry."""
   if sys.platform != "win32":
     return
-  import winreg
   try:
     key = winreg.OpenKey(
       winreg.HKEY_CURRENT_USER, STARTUP_REG_KEY, 0, winreg.KEY_SET_VALUE,
@@ -90,6 +108,9 @@ def set_launch_on_startup(enabled: bool) -> None:
 def migrate_config(config: dict[str, Any]) -> bool:
   """Fill in missing keys from defaults and bump version. Returns True if changed."""
   version = config.get("config_version", 1)
+  # Steady state: current version with every default key present
+  if version >= CONFIG_VERSION and DEFAULT_CONFIG.keys() <= config.keys():
+    return False
   changed = False
 
   # Add any keys introduced in newer versions
@@ -107,17 +128,36 @@ def migrate_config(config: dict[str, Any]) -> bool:
   return changed
 
 
+# Last config read or written: ((path, mtime_ns, size), config, serialized).
+# Lets load_config() skip the read + parse and save_config() skip the write
+# when the file hasn't changed. `serialized` is None after a plain read.
+_config_cache: tuple[tuple[str, int, int], dict[str, Any], str | None] | None = None
+
+
+def _config_stat_key() -> tuple[str, int, int] | None:
+  try:
+    st = os.stat(CONFIG_PATH)
+  except OSError:
+    return None
+  return (CONFIG_PATH, st.st_mtime_ns, st.st_size)
+
+
 def load_config() -> dict[str, Any]:
+  global _config_cache
   if not os.path.exists(CONFIG_PATH):
     log.info("No config found, creating defaults at %s", CONFIG_PATH)
-    save_config(DEFAULT_CONFIG)
+    save_config(dict(DEFAULT_CONFIG))
     return dict(DEFAULT_CONFIG)
+  stat_key = _config_stat_key()
+  if _config_cache is not None and stat_key is not None and _config_cache[0] == stat_key:
+    return dict(_config_cache[1])
   try:
-    with open(CONFIG_PATH) as f:
-      config = json.load(f)
-  except json.JSONDecodeError as e:
+    # One read + loads() instead of json.load()'s incremental reads
+    with open(CONFIG_PATH, "rb", buffering=_CONFIG_IO_BUFFER) as f:
+      config = json.loads(f.read())
+  except (json.JSONDecodeError, UnicodeDecodeError) as e:
     log.error("Corrupted config file, resetting to defaults: %s", e)
-    save_config(DEFAULT_CONFIG)
+    save_config(dict(DEFAULT_CONFIG))
     return dict(DEFAULT_CONFIG)
   except OSError as e:
     log.error("Cannot read config file: %s", e)
@@ -125,16 +165,42 @@ def load_config() -> dict[str, Any]:
 
   if migrate_config(config):
     save_config(config)
+  elif stat_key is not None:
+    _config_cache = (stat_key, dict(config), None)
   return config
 
 
 def save_config(config: dict[str, Any]) -> None:
+  """Write config atomically: temp file + fsync, then os.replace().
+
+  A crash mid-write leaves the previous config intact instead of a
+  truncated file that load_config() would reset to defaults.
+  """
+  global _config_cache
+  # Serialize up front (json.dump() issues one small write per token) and
+  # compact: the file is machine-written; load_config() reads either form
+  data = json.dumps(config, separators=(",", ":")) + "\n"
+  # Same bytes as our last write and the file is untouched since: no-op
+  if (_config_cache is not None and _config_cache[2] == data
+      and _config_cache[0] == _config_stat_key()):
+    return
+  tmp_path = CONFIG_PATH + ".tmp"
   try:
-    with open(CONFIG_PATH, "w") as f:
-      json.dump(config, f, indent=2)
-      f.write("\n")
+    with open(tmp_path, "w", buffering=_CONFIG_IO_BUFFER) as f:
+      f.write(data)
+      f.flush()
+      os.fsync(f.fileno())
+    os.replace(tmp_path, CONFIG_PATH)
   except OSError as e:
+    _config_cache = None
     log.error("Failed to save config: %s", e)
+    try:
+      os.remove(tmp_path)
+    except OSError:
+      pass
+    return
+  stat_key = _config_stat_key()
+  _config_cache = (stat_key, dict(config), data) if stat_key is not None else None
 
 
 # Tray icon geometry (64x64 canvas)
@@ -149,8 +215,9 @@ _ICON_LENS_INNER = (27, 29, 10, 14)
 _ICON_FLASH_RECT = (24, 10, 16, 8)
 
 
+@functools.lru_cache(maxsize=1)
 def create_tray_icon() -> QIcon:
-  """Generate a simple camera-style tray icon using QPainter."""
+  """Generate a simple camera-style tray icon using QPainter (rendered once)."""
   pixmap = QPixmap(_ICON_SIZE, _ICON_SIZE)
   pixmap.fill(QColor(0, 0, 0, 0))
 
@@ -185,6 +252,23 @@ class HotkeyBridge(QObject):
   fullscreen_triggered = Signal()
 
 
+# Display names for the common hotkey tokens; anything else is derived
+_HOTKEY_TOKEN_DISPLAY = {
+  "<ctrl>": "Ctrl",
+  "<alt>": "Alt",
+  "<shift>": "Shift",
+  "<cmd>": "Cmd",
+}
+
+
+def _format_hotkey_token(token: str) -> str:
+  token = token.strip()
+  if token.startswith("<") and token.endswith(">"):
+    return token[1:-1].capitalize()
+  return token.upper()
+
+
+@functools.lru_cache(maxsize=64)
 def format_hotkey_display(pynput_str: str) -> str:
   """Convert pynput hotkey format to user-friendly display format.
 
@@ -192,15 +276,38 @@ def format_hotkey_display(pynput_str: str) -> str:
   """
   if not pynput_str:
     return ""
-  parts = pynput_str.split("+")
-  nice = []
-  for p in parts:
-    p = p.strip()
-    if p.startswith("<") and p.endswith(">"):
-      nice.append(p[1:-1].capitalize())
-    else:
-      nice.append(p.upper())
-  return " + ".join(nice)
+  return " + ".join(
+    _HOTKEY_TOKEN_DISPLAY.get(p) or _format_hotkey_token(p)
+    for p in pynput_str.split("+")
+  )
+
+
+# Modifier flags in hotkey string order
+_QT_MOD_TO_PYNPUT = (
+  (Qt.KeyboardModifier.ControlModifier, "<ctrl>"),
+  (Qt.KeyboardModifier.AltModifier, "<alt>"),
+  (Qt.KeyboardModifier.ShiftModifier, "<shift>"),
+  (Qt.KeyboardModifier.MetaModifier, "<cmd>"),
+)
+
+# Non-range keys accepted by HotkeyEdit (letters, digits, F-keys handled inline)
+_QT_KEY_TO_PYNPUT = {
+  Qt.Key.Key_Space: "<space>",
+  Qt.Key.Key_Tab: "<tab>",
+  Qt.Key.Key_Return: "<enter>",
+  Qt.Key.Key_Enter: "<enter>",
+  Qt.Key.Key_Backspace: "<backspace>",
+  Qt.Key.Key_Delete: "<delete>",
+  Qt.Key.Key_Home: "<home>",
+  Qt.Key.Key_End: "<end>",
+  Qt.Key.Key_PageUp: "<page_up>",
+  Qt.Key.Key_PageDown: "<page_down>",
+  Qt.Key.Key_Up: "<up>",
+  Qt.Key.Key_Down: "<down>",
+  Qt.Key.Key_Left: "<left>",
+  Qt.Key.Key_Right: "<right>",
+  Qt.Key.Key_Insert: "<insert>",
+}
 
 
 class HotkeyEdit(QLineEdit):
@@ -213,27 +320,40 @@ class HotkeyEdit(QLineEdit):
     self.setCursor(Qt.CursorShape.PointingHandCursor)
     self._value = value
     self._recording = False
+    # Parsed once; recording toggles a property instead of swapping sheets
+    self.setStyleSheet(
+      'QLineEdit[recording="true"] { background-color: #fff3cd; color: #856404; }'
+    )
     self._update_display()
 
   def hotkey(self) -> str:
     """Return the pynput-format hotkey string."""
     return self._value
 
+  def set_hotkey(self, value: str) -> None:
+    self._value = value
+    self._update_display()
+
   def _update_display(self) -> None:
     self.setText(format_hotkey_display(self._value))
 
+  def _set_recording(self, recording: bool) -> None:
+    self._recording = recording
+    self.setProperty("recording", recording)
+    # Re-evaluate the [recording] selector for the new property value
+    self.style().unpolish(self)
+    self.style().polish(self)
+
   def mousePressEvent(self, event):
     super().mousePressEvent(event)
-    self._recording = True
+    self._set_recording(True)
     self.setText("Press a key combination...")
-    self.setStyleSheet("QLineEdit { background-color: #fff3cd; color: #856404; }")
 
   def focusOutEvent(self, event):
     super().focusOutEvent(event)
     if self._recording:
-      self._recording = False
+      self._set_recording(False)
       self._update_display()
-      self.setStyleSheet("")
 
   def keyPressEvent(self, event):
     if not self._recording:
@@ -249,21 +369,12 @@ class HotkeyEdit(QLineEdit):
 
     # Escape cancels recording
     if key == Qt.Key.Key_Escape:
-      self._recording = False
+      self._set_recording(False)
       self._update_display()
-      self.setStyleSheet("")
       self.clearFocus()
       return
 
-    parts = []
-    if mods & Qt.KeyboardModifier.ControlModifier:
-      parts.append("<ctrl>")
-    if mods & Qt.KeyboardModifier.AltModifier:
-      parts.append("<alt>")
-    if mods & Qt.KeyboardModifier.ShiftModifier:
-      parts.append("<shift>")
-    if mods & Qt.KeyboardModifier.MetaModifier:
-      parts.append("<cmd>")
+    parts = [token for flag, token in _QT_MOD_TO_PYNPUT if mods & flag]
 
     # Require at least one modifier for a global hotkey
     if not parts:
@@ -275,13 +386,13 @@ class HotkeyEdit(QLineEdit):
 
     parts.append(key_str)
     self._value = "+".join(parts)
-    self._recording = False
+    self._set_recording(False)
     self._update_display()
-    self.setStyleSheet("")
     self.clearFocus()
     self.changed.emit()
 
   @staticmethod
+  @functools.lru_cache(maxsize=256)
   def _key_to_pynput(key: Qt.Key) -> str | None:
     """Convert a Qt key code to a pynput hotkey token."""
     if Qt.Key.Key_A <= key <= Qt.Key.Key_Z:
@@ -290,26 +401,12 @@ class HotkeyEdit(QLineEdit):
       return chr(key)
     if Qt.Key.Key_F1 <= key <= Qt.Key.Key_F12:
       return f"<f{key - Qt.Key.Key_F1 + 1}>"
-    return {
-      Qt.Key.Key_Space: "<space>",
-      Qt.Key.Key_Tab: "<tab>",
-      Qt.Key.Key_Return: "<enter>",
-      Qt.Key.Key_Enter: "<enter>",
-      Qt.Key.Key_Backspace: "<backspace>",
-      Qt.Key.Key_Delete: "<delete>",
-      Qt.Key.Key_Home: "<home>",
-      Qt.Key.Key_End: "<end>",
-      Qt.Key.Key_PageUp: "<page_up>",
-      Qt.Key.Key_PageDown: "<page_down>",
-      Qt.Key.Key_Up: "<up>",
-      Qt.Key.Key_Down: "<down>",
-      Qt.Key.Key_Left: "<left>",
-      Qt.Key.Key_Right: "<right>",
-      Qt.Key.Key_Insert: "<insert>",
-    }.get(key)
+    return _QT_KEY_TO_PYNPUT.get(key)
 
 
 SAVE_DEBOUNCE_MS = 150
+CONFIG_WRITE_DELAY_MS = 250
+CONFIG_POLL_MS = 1000
 
 
 class SettingsDialog(QDialog):
@@ -318,6 +415,7 @@ class SettingsDialog(QDialog):
                parent: QWidget | None = None):
     super().__init__(parent)
     self._on_change = on_change
+    self._loading = False
     self.setWindowTitle("ImmediPaste Settings")
     self.setFixedWidth(480)
 
@@ -334,7 +432,7 @@ class SettingsDialog(QDialog):
 
     # Save folder + browse + validation
     folder_row = QHBoxLayout()
-    self.folder_edit = QLineEdit(config.get("save_folder", ""))
+    self.folder_edit = QLineEdit()
     browse_btn = QPushButton("Browse...")
     browse_btn.clicked.connect(self._browse_folder)
     folder_row.addWidget(self.folder_edit)
@@ -346,31 +444,31 @@ class SettingsDialog(QDialog):
     self.folder_warning.setWordWrap(True)
     self.folder_warning.hide()
     form.addRow("", self.folder_warning)
+    self._folder_warnings: dict[str, str] = {}
 
     # Region hotkey
-    self.hotkey_edit = HotkeyEdit(config.get("hotkey_region", "<ctrl>+<alt>+<shift>+s"))
+    self.hotkey_edit = HotkeyEdit()
     form.addRow("Region hotkey:", self.hotkey_edit)
 
     # Window hotkey
-    self.win_hotkey_edit = HotkeyEdit(config.get("hotkey_window", "<ctrl>+<alt>+<shift>+d"))
+    self.win_hotkey_edit = HotkeyEdit()
     form.addRow("Window hotkey:", self.win_hotkey_edit)
 
     # Fullscreen hotkey
-    self.fs_hotkey_edit = HotkeyEdit(config.get("hotkey_fullscreen", "<ctrl>+<alt>+<shift>+f"))
+    self.fs_hotkey_edit = HotkeyEdit()
     form.addRow("Fullscreen hotkey:", self.fs_hotkey_edit)
 
     # Format
     self.fmt_combo = QComboBox()
     self.fmt_combo.addItems(["png", "jpg", "webp"])
-    self.fmt_combo.setCurrentText(config.get("format", "png"))
     form.addRow("Save format:", self.fmt_combo)
 
     # Filename prefix
-    self.prefix_edit = QLineEdit(config.get("filename_prefix", "screenshot"))
+    self.prefix_edit = QLineEdit()
     form.addRow("Filename prefix:", self.prefix_edit)
 
     # Filename suffix (strftime format)
-    self.suffix_edit = QLineEdit(config.get("filename_suffix", "%Y-%m-%d_%H-%M-%S"))
+    self.suffix_edit = QLineEdit()
     self.suffix_edit.setToolTip("strftime format for date/time in filename (e.g. %%Y-%%m-%%d_%%H-%%M-%%S)")
     form.addRow("Filename suffix:", self.suffix_edit)
 
@@ -378,12 +476,10 @@ class SettingsDialog(QDialog):
 
     # Save to disk checkbox
     self.save_disk_check = QCheckBox("Also save screenshots to disk")
-    self.save_disk_check.setChecked(config.get("save_to_disk", True))
     layout.addWidget(self.save_disk_check)
 
     # Annotation editor checkbox
     self.annotate_check = QCheckBox("Open annotation editor after capture")
-    self.annotate_check.setChecked(config.get("annotate_captures", False))
     layout.addWidget(self.annotate_check)
 
     # Modifier-to-tool mapping combos (indented under annotation checkbox)
@@ -392,7 +488,6 @@ class SettingsDialog(QDialog):
       ("Text", "text"), ("Freehand", "freehand"),
       ("None (toolbar default)", "none"),
     ]
-    _tool_value_to_label = {v: lbl for lbl, v in _TOOL_ITEMS}
 
     mod_layout = QFormLayout()
     mod_layout.setContentsMargins(24, 0, 0, 0)
@@ -401,17 +496,9 @@ class SettingsDialog(QDialog):
     self._shift_tool_combo = QComboBox()
     self._ctrl_tool_combo = QComboBox()
     self._alt_tool_combo = QComboBox()
-    for combo, cfg_key, default in [
-      (self._default_tool_combo, "annotate_default_tool", "freehand"),
-      (self._shift_tool_combo, "annotate_shift_tool", "arrow"),
-      (self._ctrl_tool_combo, "annotate_ctrl_tool", "oval"),
-      (self._alt_tool_combo, "annotate_alt_tool", "text"),
-    ]:
+    for combo, _, _ in self._tool_combos():
       for label, value in _TOOL_ITEMS:
         combo.addItem(label, value)
-      saved = config.get(cfg_key, default)
-      idx = combo.findData(saved)
-      combo.setCurrentIndex(idx if idx >= 0 else 0)
 
     mod_layout.addRow("Default (no modifier):", self._default_tool_combo)
     mod_layout.addRow("Shift + drag:", self._shift_tool_combo)
@@ -421,7 +508,6 @@ class SettingsDialog(QDialog):
 
     # Launch on startup checkbox
     self.startup_check = QCheckBox("Launch on startup")
-    self.startup_check.setChecked(config.get("launch_on_startup", False))
     layout.addWidget(self.startup_check)
 
     # Close button
@@ -432,6 +518,8 @@ class SettingsDialog(QDialog):
     btn_layout.addWidget(close_btn)
     layout.addLayout(btn_layout)
 
+    self.set_config(config)
+
     # Position after layout is built so self.height() reflects actual content
     self._position_near_tray()
 
@@ -451,6 +539,37 @@ class SettingsDialog(QDialog):
     self._alt_tool_combo.currentIndexChanged.connect(self._emit_change)
     self.startup_check.stateChanged.connect(self._emit_change)
 
+  def _tool_combos(self) -> list[tuple[QComboBox, str, str]]:
+    return [
+      (self._default_tool_combo, "annotate_default_tool", "freehand"),
+      (self._shift_tool_combo, "annotate_shift_tool", "arrow"),
+      (self._ctrl_tool_combo, "annotate_ctrl_tool", "oval"),
+      (self._alt_tool_combo, "annotate_alt_tool", "text"),
+    ]
+
+  def set_config(self, config: dict[str, Any]) -> None:
+    """Load config values into the existing widgets (no change signals)."""
+    self._loading = True
+    try:
+      self.folder_edit.setText(config.get("save_folder", ""))
+      self.hotkey_edit.set_hotkey(config.get("hotkey_region", DEFAULT_CONFIG["hotkey_region"]))
+      self.win_hotkey_edit.set_hotkey(config.get("hotkey_window", DEFAULT_CONFIG["hotkey_window"]))
+      self.fs_hotkey_edit.set_hotkey(config.get("hotkey_fullscreen", DEFAULT_CONFIG["hotkey_fullscreen"]))
+      self.fmt_combo.setCurrentText(config.get("format", "png"))
+      self.prefix_edit.setText(config.get("filename_prefix", "screenshot"))
+      self.suffix_edit.setText(config.get("filename_suffix", "%Y-%m-%d_%H-%M-%S"))
+      self.save_disk_check.setChecked(config.get("save_to_disk", True))
+      self.annotate_check.setChecked(config.get("annotate_captures", False))
+      for combo, cfg_key, default in self._tool_combos():
+        idx = combo.findData(config.get(cfg_key, default))
+        combo.setCurrentIndex(idx if idx >= 0 else 0)
+      self.startup_check.setChecked(config.get("launch_on_startup", False))
+    finally:
+      self._loading = False
+    # The folder may have been created or removed since the last open
+    self._folder_warnings.clear()
+    self.folder_warning.hide()
+
   def done(self, result: int) -> None:
     # Flush any pending debounced save before the dialog closes
     if self._save_timer.isActive():
@@ -465,6 +584,8 @@ class SettingsDialog(QDialog):
     self.move(x, y)
 
   def _emit_change(self, *_args: Any) -> None:
+    if self._loading:
+      return
     self._validate_folder()
     if self._on_change:
       self._save_timer.start()
@@ -475,26 +596,37 @@ class SettingsDialog(QDialog):
       self._on_change(self.get_config())
 
   def _validate_folder(self) -> None:
-    """Check if the save folder path is writable and show a warning if not."""
+    """Check if the save folder path is writable and show a warning if not.
+
+    Runs on every _emit_change(), so results are cached per folder text to
+    avoid re-stat'ing an unchanged path when other settings are toggled.
+    """
     raw = self.folder_edit.text().strip()
-    if not raw:
+    warning = self._folder_warnings.get(raw)
+    if warning is None:
+      warning = self._folder_warning_for(raw)
+      self._folder_warnings[raw] = warning
+    if warning:
+      self.folder_warning.setText(warning)
+      self.folder_warning.show()
+    else:
       self.folder_warning.hide()
-      return
+
+  @staticmethod
+  def _folder_warning_for(raw: str) -> str:
+    """Return a warning for an unusable save folder, or "" if it is fine."""
+    if not raw:
+      return ""
     folder = os.path.abspath(os.path.expanduser(raw))
     if os.path.isdir(folder):
       if os.access(folder, os.W_OK):
-        self.folder_warning.hide()
-      else:
-        self.folder_warning.setText("Folder exists but is not writable")
-        self.folder_warning.show()
-    else:
-      # Check if the parent exists and is writable (folder could be created)
-      parent = os.path.dirname(folder)
-      if os.path.isdir(parent) and os.access(parent, os.W_OK):
-        self.folder_warning.hide()
-      else:
-        self.folder_warning.setText("Folder does not exist and cannot be created")
-        self.folder_warning.show()
+        return ""
+      return "Folder exists but is not writable"
+    # Check if the parent exists and is writable (folder could be created)
+    parent = os.path.dirname(folder)
+    if os.path.isdir(parent) and os.access(parent, os.W_OK):
+      return ""
+    return "Folder does not exist and cannot be created"
 
   def _browse_folder(self) -> None:
     path = QFileDialog.getExistingDirectory(
@@ -524,24 +656,55 @@ class SettingsDialog(QDialog):
     }
 
 
+_HOTKEY_CONFIG_KEYS = ("hotkey_region", "hotkey_window", "hotkey_fullscreen")
+
+
 class ImmediPaste:
-  def __init__(self) -> None:
+  def __init__(self, lock_file: IO[str] | None = None) -> None:
     self.config: dict[str, Any] = load_config()
+    self._lock_file = lock_file
     self.capturing: bool = False
     self.tray_icon: QSystemTrayIcon | None = None
-    self.capture_history: list[str] = []
+    self.tray_menu: QMenu | None = None
+    self.capture_history: collections.deque[str] = collections.deque(maxlen=MAX_HISTORY)
     self._overlay: CaptureOverlay | None = None
-    self._editor = None
+    self._editor: AnnotationEditor | None = None
+    self._settings_dialog: SettingsDialog | None = None
     self._last_capture_path: str | None = None
-
-    # Ensure save folder exists
-    folder = os.path.expanduser(self.config.get("save_folder", ""))
-    if folder:
+    self._capture_kwargs: dict[str, Any] = self._build_capture_kwargs()
+    self._parsed_hotkeys: dict[str, list] = {}
+    # Hotkey strings the running listener was started with (None = stopped)
+    self._active_hotkeys: tuple[str, ...] | None = None
+
+    # Coalesce config writes from bursts of settings changes (save_config()
+    # itself skips the write if the result matches what is already on disk)
+    self._config_write_timer = QTimer()
+    self._config_write_timer.setSingleShot(True)
+    self._config_write_timer.setInterval(CONFIG_WRITE_DELAY_MS)
+    self._config_write_timer.timeout.connect(self._write_config)
+    # Stat key of config.json as last read/written by us; anything else
+    # seen by the poller is an external edit
+    self._config_stat = _config_stat_key()
+
+    # Ensure save folder exists (one stat in the common already-there case)
+    folder = self._capture_kwargs["save_folder"]
+    if folder and not os.path.isdir(folder):
       try:
         os.makedirs(folder, exist_ok=True)
       except OSError as e:
         log.warning("Cannot create save folder '%s': %s", folder, e)
 
+  def _build_capture_kwargs(self) -> dict[str, Any]:
+    """Resolve the CaptureOverlay settings from config once per change."""
+    return {
+      # Expanded here so each save doesn't redo it
+      "save_folder": os.path.expanduser(self.config["save_folder"]),
+      "fmt": self.config.get("format", "png"),
+      "save_to_disk": self.config.get("save_to_disk", True),
+      "filename_prefix": self.config.get("filename_prefix", "screenshot"),
+      "filename_suffix": self.config.get("filename_suffix", "%Y-%m-%d_%H-%M-%S"),
+    }
+
   def _get_image_ready_callback(self) -> Callable | None:
     """Return an image callback if annotation mode is enabled, else None."""
     if not self.config.get("annotate_captures", False):
@@ -558,11 +721,7 @@ class ImmediPaste:
     }
     self._editor = AnnotationEditor(
       qimage=qimage,
-      save_folder=self.config["save_folder"],
-      fmt=self.config.get("format", "png"),
-      save_to_disk=self.config.get("save_to_disk", True),
-      filename_prefix=self.config.get("filename_prefix", "screenshot"),
-      filename_suffix=self.config.get("filename_suffix", "%Y-%m-%d_%H-%M-%S"),
+      **self._capture_kwargs,
       on_done=self._on_capture_done,
       modifier_tools=modifier_tools,
       default_tool=self.config.get("annotate_default_tool", "freehand"),
@@ -578,12 +737,9 @@ class ImmediPaste:
       return
     self.capturing = True
 
+    from capture import CaptureOverlay
     self._overlay = CaptureOverlay(
-      save_folder=self.config["save_folder"],
-      fmt=self.config.get("format", "png"),
-      save_to_disk=self.config.get("save_to_disk", True),
-      filename_prefix=self.config.get("filename_prefix", "screenshot"),
-      filename_suffix=self.config.get("filename_suffix", "%Y-%m-%d_%H-%M-%S"),
+      **self._capture_kwargs,
       on_done=self._on_capture_done,
       on_image_ready=self._get_image_ready_callback(),
     )
@@ -594,7 +750,7 @@ class ImmediPaste:
     if self.capturing:
       return
 
-    if platform.system() != "Windows":
+    if not IS_WINDOWS:
       log.warning("Window capture is not supported on this platform")
       if self.tray_icon:
         self.tray_icon.showMessage(
@@ -605,12 +761,9 @@ class ImmediPaste:
 
     self.capturing = True
 
+    from capture import CaptureOverlay
     self._overlay = CaptureOverlay(
-      save_folder=self.config["save_folder"],
-      fmt=self.config.get("format", "png"),
-      save_to_disk=self.config.get("save_to_disk", True),
-      filename_prefix=self.config.get("filename_prefix", "screenshot"),
-      filename_suffix=self.config.get("filename_suffix", "%Y-%m-%d_%H-%M-%S"),
+      **self._capture_kwargs,
       on_done=self._on_capture_done,
       on_image_ready=self._get_image_ready_callback(),
       mode="window",
@@ -623,12 +776,9 @@ class ImmediPaste:
       return
     self.capturing = True
 
+    from capture import CaptureOverlay
     self._overlay = CaptureOverlay(
-      save_folder=self.config["save_folder"],
-      fmt=self.config.get("format", "png"),
-      save_to_disk=self.config.get("save_to_disk", True),
-      filename_prefix=self.config.get("filename_prefix", "screenshot"),
-      filename_suffix=self.config.get("filename_suffix", "%Y-%m-%d_%H-%M-%S"),
+      **self._capture_kwargs,
       on_done=self._on_capture_done,
       on_image_ready=self._get_image_ready_callback(),
     )
@@ -654,8 +804,8 @@ class ImmediPaste:
 
     if filepath:
       self.capture_history.append(filepath)
-      if len(self.capture_history) > MAX_HISTORY:
-        self.capture_history = self.capture_history[-MAX_HISTORY:]
+      if self.tray_menu is not None:
+        self._add_history_action(filepath)
       self._last_capture_path = filepath
       log.info("Captured: %s", filepath)
 
@@ -673,11 +823,23 @@ class ImmediPaste:
 
   @staticmethod
   def _show_in_explorer(filepath: str) -> None:
+    # The shell call / process launch can stall for a while (busy Explorer,
+    # CreateProcess); keep it off the Qt thread so the tray stays responsive
+    threading.Thread(
+      target=ImmediPaste._reveal_file, args=(filepath,),
+      name="show-in-explorer", daemon=True,
+    ).start()
+
+  @staticmethod
+  def _reveal_file(filepath: str) -> None:
+    # In-process shell call on Windows; explorer.exe is only spawned as fallback
+    if IS_WINDOWS and select_in_explorer is not None and select_in_explorer(filepath):
+      return
+    import subprocess
     try:
-      system = platform.system()
-      if system == "Windows":
+      if IS_WINDOWS:
         subprocess.Popen(["explorer", "/select,", os.path.normpath(filepath)])
-      elif system == "Darwin":
+      elif IS_MACOS:
         subprocess.Popen(["open", "-R", filepath])
       else:
         subprocess.Popen(["xdg-open", os.path.dirname(filepath)])
@@ -686,23 +848,77 @@ class ImmediPaste:
 
   def _apply_settings(self, new_config: dict[str, Any]) -> None:
     """Called on every settings change for live auto-save."""
+    changes = {
+      k: v for k, v in new_config.items()
+      if k not in self.config or self.config[k] != v
+    }
+    # Stray focus-out / re-emits with identical values: nothing to do
+    if not changes:
+      return
     old_config = dict(self.config)
-    self.config.update(new_config)
-    save_config(self.config)
-    if new_config.get("launch_on_startup") != old_config.get("launch_on_startup"):
+    self.config.update(changes)
+    self._capture_kwargs = self._build_capture_kwargs()
+    self._config_write_timer.start()
+    changed_hotkeys = [k for k in _HOTKEY_CONFIG_KEYS if k in changes]
+    for k in changed_hotkeys:
+      self._parsed_hotkeys.pop(old_config.get(k), None)
+    if changed_hotkeys and self.tray_menu is not None:
+      self._update_tray_hotkey_labels()
+    if "launch_on_startup" in changes:
       set_launch_on_startup(self.config.get("launch_on_startup", False))
-    log.debug("Settings updated: %s",
-      {k: v for k, v in new_config.items() if old_config.get(k) != v})
+    log.debug("Settings updated: %s", changes)
+
+  def _write_config(self) -> None:
+    """Write the pending config to disk (debounced via _config_write_timer)."""
+    self._config_write_timer.stop()
+    save_config(self.config)
+    self._config_stat = _config_stat_key()
+
+  def _check_config_file(self) -> None:
+    """Pick up external edits to config.json (polled by _config_poll_timer)."""
+    stat_key = _config_stat_key()
+    if stat_key is None or stat_key == self._config_stat:
+      return
+    # Our own pending write is newer; the dialog owns the listener while open
+    if self._config_write_timer.isActive():
+      return
+    if self._settings_dialog is not None and self._settings_dialog.isVisible():
+      return
+    self._config_stat = stat_key
+    try:
+      with open(CONFIG_PATH, "rb") as f:
+        edited = json.loads(f.read())
+    except (OSError, ValueError) as e:
+      # Likely a half-saved edit; keep the current settings, don't reset
+      log.warning("Ignoring unreadable config edit: %s", e)
+      return
+    if not isinstance(edited, dict):
+      log.warning("Ignoring config edit: top level is not an object")
+      return
+    migrated = migrate_config(edited)
+    log.info("Config file changed on disk, reloading")
+    self._apply_settings(edited)
+    if not migrated:
+      # Already on disk as-is: don't write it back
+      self._config_write_timer.stop()
+    self.reload_settings()
 
   def open_settings(self) -> None:
     # Pause hotkey listener so keypresses don't trigger captures
+    self._active_hotkeys = None
     try:
       self._listener.stop()
     except Exception as e:
       log.warning("Failed to stop hotkey listener: %s", e)
 
-    dialog = SettingsDialog(self.config, on_change=self._apply_settings)
-    dialog.setWindowFlags(dialog.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
+    # Built on first open, then reused with fresh values
+    dialog = self._settings_dialog
+    if dialog is None:
+      dialog = SettingsDialog(self.config, on_change=self._apply_settings)
+      dialog.setWindowFlags(dialog.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
+      self._settings_dialog = dialog
+    else:
+      dialog.set_config(self.config)
     dialog.exec()
 
     # Restart listener with (possibly new) hotkeys
@@ -717,49 +933,110 @@ class ImmediPaste:
           QSystemTrayIcon.MessageIcon.Warning, 5000,
         )
 
+  def _parse_hotkey_keys(self, hotkey_str: str) -> list:
+    """Parse a pynput hotkey string, reusing the result across listener restarts."""
+    keys = self._parsed_hotkeys.get(hotkey_str)
+    if keys is None:
+      from pynput import keyboard
+      keys = keyboard.HotKey.parse(hotkey_str)
+      self._parsed_hotkeys[hotkey_str] = keys
+    return keys
+
+  def _start_native_hotkeys(self, specs: tuple[tuple[str, Callable[[], None]], ...]) -> bool:
+    """Register hotkeys with the OS. Returns False to fall back to pynput."""
+    bindings = []
+    for hotkey_str, callback in specs:
+      parsed = parse_native_hotkey(hotkey_str)
+      if parsed is None:
+        log.debug("Hotkey '%s' has no native equivalent, using pynput", hotkey_str)
+        return False
+      bindings.append((*parsed, callback))
+
+    listener = NativeHotkeyListener(bindings)
+    try:
+      listener.start()
+    except OSError as e:
+      log.warning("Native hotkey registration failed (%s), using pynput", e)
+      return False
+    self._listener = listener
+    log.debug("Native hotkeys registered (%s)", ", ".join(s for s, _ in specs))
+    return True
+
+  def _hotkey_strings(self) -> tuple[str, ...]:
+    return tuple(self.config.get(k) for k in _HOTKEY_CONFIG_KEYS)
+
   def _start_hotkey_listener(self) -> None:
-    region_str = self.config.get("hotkey_region", "<ctrl>+<alt>+<shift>+s")
-    window_str = self.config.get("hotkey_window", "<ctrl>+<alt>+<shift>+d")
-    fullscreen_str = self.config.get("hotkey_fullscreen", "<ctrl>+<alt>+<shift>+f")
+    region_str = self.config.get("hotkey_region", DEFAULT_CONFIG["hotkey_region"])
+    window_str = self.config.get("hotkey_window", DEFAULT_CONFIG["hotkey_window"])
+    fullscreen_str = self.config.get("hotkey_fullscreen", DEFAULT_CONFIG["hotkey_fullscreen"])
+
+    # Prefer OS-level hotkeys (no per-keystroke Python callback); pynput's
+    # global hook remains the fallback and the only option off Windows
+    if NativeHotkeyListener is not None and self._start_native_hotkeys((
+      (region_str, self.hotkey_bridge.region_triggered.emit),
+      (window_str, self.hotkey_bridge.window_triggered.emit),
+      (fullscreen_str, self.hotkey_bridge.fullscreen_triggered.emit),
+    )):
+      self._active_hotkeys = self._hotkey_strings()
+      return
 
-    def _parse_hotkey(hotkey_str, default_str, signal):
+    from pynput import keyboard
+
+    def _parse_hotkey(hotkey_str, default_str):
       try:
-        return keyboard.HotKey(keyboard.HotKey.parse(hotkey_str), signal)
+        return self._parse_hotkey_keys(hotkey_str)
       except ValueError as e:
         log.error("Invalid hotkey '%s': %s -- using default '%s'", hotkey_str, e, default_str)
-        return keyboard.HotKey(keyboard.HotKey.parse(default_str), signal)
+        return self._parse_hotkey_keys(default_str)
+
+    # One table for all hotkeys: the set of held hotkey keys -> callback.
+    # Each key event is one set update and one dict probe, instead of
+    # feeding every event through a HotKey object per hotkey.
+    table = {
+      frozenset(_parse_hotkey(region_str, DEFAULT_CONFIG["hotkey_region"])):
+        self.hotkey_bridge.region_triggered.emit,
+      frozenset(_parse_hotkey(window_str, DEFAULT_CONFIG["hotkey_window"])):
+        self.hotkey_bridge.window_triggered.emit,
+      frozenset(_parse_hotkey(fullscreen_str, DEFAULT_CONFIG["hotkey_fullscreen"])):
+        self.hotkey_bridge.fullscreen_triggered.emit,
+    }
+    # Only keys that belong to some hotkey are tracked, so unrelated keys
+    # (or a missed release of one) never block a combo
+    tracked = frozenset().union(*table)
+    pressed: set = set()
 
-    hotkey_region = _parse_hotkey(
-      region_str, "<ctrl>+<alt>+<shift>+s",
-      self.hotkey_bridge.region_triggered.emit,
-    )
-    hotkey_window = _parse_hotkey(
-      window_str, "<ctrl>+<alt>+<shift>+d",
-      self.hotkey_bridge.window_triggered.emit,
-    )
-    hotkey_fullscreen = _parse_hotkey(
-      fullscreen_str, "<ctrl>+<alt>+<shift>+f",
-      self.hotkey_bridge.fullscreen_triggered.emit,
-    )
+    # canonical() is a pure mapping (lowercase chars, merge left/right
+    # modifiers) and the same few physical keys repeat constantly
+    @functools.lru_cache(maxsize=256)
+    def canonical(k):
+      return self._listener.canonical(k)
 
     def on_press(k):
-      key = self._listener.canonical(k)
-      hotkey_region.press(key)
-      hotkey_window.press(key)
-      hotkey_fullscreen.press(key)
+      key = canonical(k)
+      # Auto-repeat of a held key must not re-trigger
+      if key not in tracked or key in pressed:
+        return
+      pressed.add(key)
+      callback = table.get(frozenset(pressed))
+      if callback is not None:
+        callback()
 
     def on_release(k):
-      key = self._listener.canonical(k)
-      hotkey_region.release(key)
-      hotkey_window.release(key)
-      hotkey_fullscreen.release(key)
+      pressed.discard(canonical(k))
 
     self._listener = keyboard.Listener(on_press=on_press, on_release=on_release)
     self._listener.start()
+    self._active_hotkeys = self._hotkey_strings()
     log.debug("Hotkey listener started (region=%s, window=%s, fullscreen=%s)",
       region_str, window_str, fullscreen_str)
 
   def reload_settings(self) -> None:
+    # Restarting tears down and recreates the listener thread; skip it when
+    # the running listener already has the configured hotkeys
+    if self._active_hotkeys == self._hotkey_strings():
+      log.debug("Hotkeys unchanged, keeping listener")
+      return
+    self._active_hotkeys = None
     try:
       self._listener.stop()
     except Exception as e:
@@ -769,36 +1046,62 @@ class ImmediPaste:
     except Exception as e:
       log.error("Failed to restart hotkey listener during reload: %s", e)
 
-  def _rebuild_tray_menu(self) -> None:
-    self.tray_menu.clear()
+  def _build_tray_menu(self) -> None:
+    """Create the tray menu once; captures update the history section in place."""
+    self._region_action = self.tray_menu.addAction("")
+    self._region_action.triggered.connect(self.trigger_capture)
 
-    region_hk = format_hotkey_display(self.config.get("hotkey_region", ""))
-    window_hk = format_hotkey_display(self.config.get("hotkey_window", ""))
-    fullscreen_hk = format_hotkey_display(self.config.get("hotkey_fullscreen", ""))
+    self._window_action = self.tray_menu.addAction("")
+    self._window_action.triggered.connect(self.trigger_window_capture)
 
-    region_action = self.tray_menu.addAction("Capture Region  (%s)" % region_hk)
-    region_action.triggered.connect(self.trigger_capture)
+    self._fullscreen_action = self.tray_menu.addAction("")
+    self._fullscreen_action.triggered.connect(self.trigger_fullscreen)
 
-    window_action = self.tray_menu.addAction("Capture Window  (%s)" % window_hk)
-    window_action.triggered.connect(self.trigger_window_capture)
+    # History entries are inserted between these two separators
+    self._history_separator = self.tray_menu.addSeparator()
+    self._history_separator.setVisible(False)
+    self._history_actions: list[QAction] = []
+    self._settings_separator = self.tray_menu.addSeparator()
+    for path in self.capture_history:
+      self._add_history_action(path)
 
-    fullscreen_action = self.tray_menu.addAction("Capture Fullscreen  (%s)" % fullscreen_hk)
-    fullscreen_action.triggered.connect(self.trigger_fullscreen)
-
-    if self.capture_history:
-      self.tray_menu.addSeparator()
-      for path in reversed(self.capture_history):
-        name = os.path.basename(path)
-        action = self.tray_menu.addAction(name)
-        action.triggered.connect(functools.partial(self._show_in_explorer, path))
-
-    self.tray_menu.addSeparator()
     settings_action = self.tray_menu.addAction("Settings")
     settings_action.triggered.connect(self.open_settings)
 
     exit_action = self.tray_menu.addAction("Exit")
     exit_action.triggered.connect(self.app.quit)
 
+    # One dispatcher for all history entries (identified by their data)
+    self.tray_menu.triggered.connect(self._on_tray_action_triggered)
+
+    self._update_tray_hotkey_labels()
+
+  def _on_tray_action_triggered(self, action: QAction) -> None:
+    path = action.data()
+    if path:
+      self._show_in_explorer(path)
+
+  def _update_tray_hotkey_labels(self) -> None:
+    region_hk = format_hotkey_display(self.config.get("hotkey_region", ""))
+    window_hk = format_hotkey_display(self.config.get("hotkey_window", ""))
+    fullscreen_hk = format_hotkey_display(self.config.get("hotkey_fullscreen", ""))
+    self._region_action.setText("Capture Region  (%s)" % region_hk)
+    self._window_action.setText("Capture Window  (%s)" % window_hk)
+    self._fullscreen_action.setText("Capture Fullscreen  (%s)" % fullscreen_hk)
+
+  def _add_history_action(self, path: str) -> None:
+    """Insert a capture at the top of the tray history, dropping the oldest."""
+    action = QAction(os.path.basename(path), self.tray_menu)
+    action.setData(path)
+    before = self._history_actions[0] if self._history_actions else self._settings_separator
+    self.tray_menu.insertAction(before, action)
+    self._history_actions.insert(0, action)
+    while len(self._history_actions) > MAX_HISTORY:
+      oldest = self._history_actions.pop()
+      self.tray_menu.removeAction(oldest)
+      oldest.deleteLater()
+    self._history_separator.setVisible(True)
+
   def run(self) -> None:
     self.app = QApplication(sys.argv)
     self.app.setQuitOnLastWindowClosed(False)
@@ -822,7 +1125,7 @@ class ImmediPaste:
     self.tray_icon.setToolTip("ImmediPaste")
 
     self.tray_menu = QMenu()
-    self.tray_menu.aboutToShow.connect(self._rebuild_tray_menu)
+    self._build_tray_menu()
     self.tray_icon.setContextMenu(self.tray_menu)
 
     self.tray_icon.messageClicked.connect(self._on_notification_clicked)
@@ -830,6 +1133,22 @@ class ImmediPaste:
 
     self.app.aboutToQuit.connect(self._shutdown)
 
+    # Keep the single-instance lock fresh so it is never mistaken for stale
+    if self._lock_file is not None:
+      self._lock_timer = QTimer(self.app)
+      self._lock_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+      self._lock_timer.setInterval(LOCK_HEARTBEAT_SECONDS * 1000)
+      self._lock_timer.timeout.connect(self._refresh_lock)
+      self._lock_timer.start()
+
+    # Whole-second accuracy is plenty for polling (same for the heartbeat
+    # above); VeryCoarseTimer lets the wakeups coalesce with other timers
+    self._config_poll_timer = QTimer(self.app)
+    self._config_poll_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+    self._config_poll_timer.setInterval(CONFIG_POLL_MS)
+    self._config_poll_timer.timeout.connect(self._check_config_file)
+    self._config_poll_timer.start()
+
     log.info("ImmediPaste running (region=%s, window=%s, fullscreen=%s)",
       self.config.get("hotkey_region"), self.config.get("hotkey_window"),
       self.config.get("hotkey_fullscreen"))
@@ -837,42 +1156,51 @@ class ImmediPaste:
     exit_code = self.app.exec()
     sys.exit(exit_code)
 
+  def _refresh_lock(self) -> None:
+    try:
+      write_lock_timestamp(self._lock_file)
+    except OSError as e:
+      log.warning("Failed to refresh lock file timestamp: %s", e)
+
   def _shutdown(self) -> None:
     """Clean up resources before the application exits."""
     try:
       self._listener.stop()
     except Exception as e:
       log.warning("Failed to stop hotkey listener on shutdown: %s", e)
+    if self._config_write_timer.isActive():
+      self._write_config()
     log.info("ImmediPaste exiting")
 
 
-LOCK_TIMEOUT_SECONDS = 3600  # 1 hour
+LOCK_TIMEOUT_SECONDS = 30
+LOCK_HEARTBEAT_SECONDS = 10  # well under LOCK_TIMEOUT_SECONDS
+
+
+def write_lock_timestamp(fh: IO[str]) -> None:
+  """Record the current time in the held lock file (startup + heartbeat)."""
+  fh.seek(0)
+  fh.truncate()
+  fh.write(str(time.time()))
+  fh.flush()
 
 
 def acquire_single_instance() -> IO[str]:
   """Ensure only one instance of ImmediPaste is running.
 
-  Uses a lock file with a timestamp. If the lock is held but the timestamp
-  is older than LOCK_TIMEOUT_SECONDS, the stale lock is broken and reacquired.
+  Uses a lock file with a timestamp that the running instance refreshes
+  every LOCK_HEARTBEAT_SECONDS. If the lock is held but the timestamp is
+  older than LOCK_TIMEOUT_SECONDS (owner hung), the lock is broken and
+  reacquired.
   """
-  import tempfile
   lock_path = os.path.join(tempfile.gettempdir(), "immedipaste.lock")
 
   def _try_lock(fh):
     if sys.platform == "win32":
-      import msvcrt
       msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
     else:
-      import fcntl
       fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
 
-  def _write_timestamp(fh):
-    import time
-    fh.seek(0)
-    fh.truncate()
-    fh.write(str(time.time()))
-    fh.flush()
-
   # Read existing timestamp and open without truncation to preserve it
   # for other instances. Use "r+" (no truncation) for existing files,
   # "w" only when creating a new lock file.
@@ -898,7 +1226,6 @@ def acquire_single_instance() -> IO[str]:
     _try_lock(lock_file)
   except OSError:
     # Lock is held -- check if it's stale
-    import time
     if saved_timestamp is not None:
       age = time.time() - saved_timestamp
       if age > LOCK_TIMEOUT_SECONDS:
@@ -925,11 +1252,11 @@ def acquire_single_instance() -> IO[str]:
       log.info("Another instance is already running, exiting")
       sys.exit(0)
 
-  _write_timestamp(lock_file)
+  write_lock_timestamp(lock_file)
   return lock_file
 
 
 if __name__ == "__main__":
   _lock = acquire_single_instance()
-  app = ImmediPaste()
+  app = ImmediPaste(lock_file=_lock)
   app.run()
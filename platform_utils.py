@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import os
-import platform
+import sys
+import threading
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import Callable, TYPE_CHECKING
 
 from log import get_logger
 
 if TYPE_CHECKING:
   from PySide6.QtGui import QImage
 
-SYSTEM = platform.system()
+# sys.platform is a constant; platform.system() would go through uname()
+IS_WINDOWS = sys.platform == "win32"
+IS_MACOS = sys.platform == "darwin"
+IS_LINUX = not (IS_WINDOWS or IS_MACOS)
 log = get_logger("platform")
 
 
@@ -34,7 +38,8 @@ def save_qimage(qimage: QImage, save_folder: str, fmt: str = "png",
   """Save a QImage to disk. Returns the filepath on success, None on failure."""
   try:
     folder = os.path.expanduser(save_folder)
-    os.makedirs(folder, exist_ok=True)
+    if not os.path.isdir(folder):
+      os.makedirs(folder, exist_ok=True)
   except OSError as e:
     log.error("Cannot create save folder '%s': %s", save_folder, e)
     return None
@@ -69,12 +74,235 @@ def default_save_folder() -> str:
   """Return a sensible default screenshot folder per platform."""
   home = os.path.expanduser("~")
 
-  if SYSTEM == "Windows":
+  if IS_WINDOWS:
     onedrive = os.path.join(home, "OneDrive", "Pictures", "Screenshots")
     if os.path.isdir(onedrive):
       return "~/OneDrive/Pictures/Screenshots"
     return "~/Pictures/Screenshots"
-  elif SYSTEM == "Darwin":
+  elif IS_MACOS:
     return "~/Desktop"
   else:
     return "~/Pictures/Screenshots"
+
+
+# -- Native global hotkeys (Windows) ------------------------------------------
+
+# RegisterHotKey modifier flags
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_WIN = 0x0008
+MOD_NOREPEAT = 0x4000
+
+# How long start() waits for the hotkey thread to finish registering
+NATIVE_HOTKEY_START_TIMEOUT = 5.0
+
+_HOTKEY_MODIFIERS = {
+  "<ctrl>": MOD_CONTROL,
+  "<alt>": MOD_ALT,
+  "<shift>": MOD_SHIFT,
+  "<cmd>": MOD_WIN,
+}
+
+# Virtual-key codes for the special keys HotkeyEdit can record
+_HOTKEY_VKS = {
+  "<space>": 0x20,
+  "<tab>": 0x09,
+  "<enter>": 0x0D,
+  "<backspace>": 0x08,
+  "<delete>": 0x2E,
+  "<home>": 0x24,
+  "<end>": 0x23,
+  "<page_up>": 0x21,
+  "<page_down>": 0x22,
+  "<up>": 0x26,
+  "<down>": 0x28,
+  "<left>": 0x25,
+  "<right>": 0x27,
+  "<insert>": 0x2D,
+}
+_HOTKEY_VKS.update({"<f%d>" % n: 0x70 + n - 1 for n in range(1, 25)})
+
+
+def parse_native_hotkey(hotkey_str: str) -> tuple[int, int] | None:
+  """Convert a pynput hotkey string to RegisterHotKey (modifiers, vk).
+
+  '<ctrl>+<alt>+<shift>+s' -> (MOD_CONTROL | MOD_ALT | MOD_SHIFT, 0x53).
+  Returns None if the string uses anything RegisterHotKey can't express
+  (no modifier, several non-modifier keys, punctuation, ...).
+  """
+  mods = 0
+  vk = None
+  for token in hotkey_str.lower().split("+"):
+    if token in _HOTKEY_MODIFIERS:
+      mods |= _HOTKEY_MODIFIERS[token]
+    elif vk is not None:
+      return None
+    elif token in _HOTKEY_VKS:
+      vk = _HOTKEY_VKS[token]
+    elif len(token) == 1 and (token.isascii() and token.isalnum()):
+      vk = ord(token.upper())
+    else:
+      return None
+  if not mods or vk is None:
+    return None
+  return mods, vk
+
+
+if IS_WINDOWS:
+  import ctypes
+  import ctypes.wintypes
+
+  _user32 = ctypes.WinDLL("user32", use_last_error=True)
+  _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+  WM_QUIT = 0x0012
+  WM_HOTKEY = 0x0312
+  PM_NOREMOVE = 0x0000
+
+  _user32.RegisterHotKey.argtypes = [
+    ctypes.wintypes.HWND, ctypes.c_int, ctypes.wintypes.UINT, ctypes.wintypes.UINT,
+  ]
+  _user32.RegisterHotKey.restype = ctypes.wintypes.BOOL
+  _user32.UnregisterHotKey.argtypes = [ctypes.wintypes.HWND, ctypes.c_int]
+  _user32.UnregisterHotKey.restype = ctypes.wintypes.BOOL
+  _user32.GetMessageW.argtypes = [
+    ctypes.POINTER(ctypes.wintypes.MSG), ctypes.wintypes.HWND,
+    ctypes.wintypes.UINT, ctypes.wintypes.UINT,
+  ]
+  _user32.GetMessageW.restype = ctypes.wintypes.BOOL
+  _user32.PeekMessageW.argtypes = [
+    ctypes.POINTER(ctypes.wintypes.MSG), ctypes.wintypes.HWND,
+    ctypes.wintypes.UINT, ctypes.wintypes.UINT, ctypes.wintypes.UINT,
+  ]
+  _user32.PeekMessageW.restype = ctypes.wintypes.BOOL
+  _user32.PostThreadMessageW.argtypes = [
+    ctypes.wintypes.DWORD, ctypes.wintypes.UINT,
+    ctypes.wintypes.WPARAM, ctypes.wintypes.LPARAM,
+  ]
+  _user32.PostThreadMessageW.restype = ctypes.wintypes.BOOL
+  _kernel32.GetCurrentThreadId.restype = ctypes.wintypes.DWORD
+
+  class NativeHotkeyListener:
+    """Global hotkeys via Win32 RegisterHotKey.
+
+    The OS matches the combos and posts one WM_HOTKEY per trigger to a
+    dedicated message-loop thread, so no Python code runs per keystroke
+    (unlike a pynput low-level hook). Callbacks run on that thread -- pass
+    Qt signal emitters, never UI calls. Mirrors pynput's Listener API
+    (start/stop) so main.py can swap one for the other.
+    """
+
+    def __init__(self, bindings: list[tuple[int, int, Callable[[], None]]]):
+      self._bindings = bindings
+      self._thread: threading.Thread | None = None
+      self._thread_id = 0
+      self._ready = threading.Event()
+      self._error: OSError | None = None
+
+    def start(self, timeout: float = NATIVE_HOTKEY_START_TIMEOUT) -> None:
+      """Register all hotkeys. Raises OSError if any can't be registered."""
+      self._thread = threading.Thread(
+        target=self._run, name="native-hotkeys", daemon=True,
+      )
+      self._thread.start()
+      if not self._ready.wait(timeout):
+        raise OSError("Hotkey thread did not start within %.0fs" % timeout)
+      if self._error is not None:
+        self._thread.join()
+        raise self._error
+
+    def stop(self) -> None:
+      if self._thread is None or not self._thread.is_alive():
+        return
+      _user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+      self._thread.join()
+
+    def _run(self) -> None:
+      callbacks: dict[int, Callable[[], None]] = {}
+      try:
+        # Hotkeys registered with hWnd=NULL post WM_HOTKEY to the registering
+        # thread, so registration and the message loop must share this thread
+        self._thread_id = _kernel32.GetCurrentThreadId()
+        msg = ctypes.wintypes.MSG()
+        # Create the thread's message queue before anyone can post WM_QUIT
+        _user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_NOREMOVE)
+
+        for hotkey_id, (mods, vk, callback) in enumerate(self._bindings, start=1):
+          if not _user32.RegisterHotKey(None, hotkey_id, mods | MOD_NOREPEAT, vk):
+            self._error = ctypes.WinError(ctypes.get_last_error())
+            return
+          callbacks[hotkey_id] = callback
+
+        self._ready.set()
+        while _user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+          if msg.message == WM_HOTKEY:
+            callback = callbacks.get(msg.wParam)
+            if callback is not None:
+              try:
+                callback()
+              except Exception as e:
+                log.error("Hotkey callback failed: %s", e)
+      except Exception as e:
+        # Surface it to start() (which falls back to pynput) instead of
+        # leaving the main thread waiting on _ready
+        self._error = self._error or OSError(str(e))
+      finally:
+        for hotkey_id in callbacks:
+          _user32.UnregisterHotKey(None, hotkey_id)
+        self._ready.set()
+
+  # -- Show in Explorer -------------------------------------------------------
+
+  _shell32 = ctypes.WinDLL("shell32", use_last_error=True)
+  _ole32 = ctypes.WinDLL("ole32", use_last_error=True)
+
+  COINIT_APARTMENTTHREADED = 0x2
+
+  _shell32.ILCreateFromPathW.argtypes = [ctypes.wintypes.LPCWSTR]
+  _shell32.ILCreateFromPathW.restype = ctypes.c_void_p
+  _shell32.ILFree.argtypes = [ctypes.c_void_p]
+  _shell32.ILFree.restype = None
+  _shell32.SHOpenFolderAndSelectItems.argtypes = [
+    ctypes.c_void_p, ctypes.wintypes.UINT, ctypes.c_void_p, ctypes.wintypes.DWORD,
+  ]
+  _shell32.SHOpenFolderAndSelectItems.restype = ctypes.HRESULT
+  _ole32.CoInitializeEx.argtypes = [ctypes.c_void_p, ctypes.wintypes.DWORD]
+  _ole32.CoInitializeEx.restype = ctypes.HRESULT
+  _ole32.CoUninitialize.argtypes = []
+  _ole32.CoUninitialize.restype = None
+
+  def select_in_explorer(filepath: str) -> bool:
+    """Open the file's folder in the running Explorer with the file selected.
+
+    Same result as `explorer /select,` without spawning a new explorer.exe
+    per call. Returns False if the shell call fails, so the caller can
+    fall back to the subprocess route.
+    """
+    # Called on the short-lived "show-in-explorer" worker thread, where COM
+    # is not initialized yet (S_OK). Initialize an STA before creating the
+    # PIDL and uninitialize once the shell call is done.
+    try:
+      _ole32.CoInitializeEx(None, COINIT_APARTMENTTHREADED)
+      initialized = True
+    except OSError:
+      initialized = False  # RPC_E_CHANGED_MODE: COM is up in another mode
+    try:
+      pidl = _shell32.ILCreateFromPathW(os.path.abspath(filepath))
+      if not pidl:
+        return False
+      try:
+        _shell32.SHOpenFolderAndSelectItems(pidl, 0, None, 0)
+      except OSError as e:
+        log.debug("SHOpenFolderAndSelectItems failed: %s", e)
+        return False
+      finally:
+        _shell32.ILFree(pidl)
+    finally:
+      if initialized:
+        _ole32.CoUninitialize()
+    return True
+
+else:
+  NativeHotkeyListener = None
+  select_in_explorer = None
@@ -6,9 +6,6 @@ from unittest.mock import patch, MagicMock
 import pytest
 from PySide6.QtCore import QPointF, QRectF, QPoint, QRect, Qt
 from PySide6.QtGui import QImage, QColor
-from PySide6.QtWidgets import QApplication
-
-app = QApplication.instance() or QApplication([])
 
 from annotation_editor import (
   FreehandAnnotation, ArrowAnnotation, OvalAnnotation, RectAnnotation,
@@ -20,7 +17,8 @@ from annotation_editor import (
 
 def make_test_image(w=200, h=150):
   """Create a small solid-color QImage for testing."""
-  img = QImage(w, h, QImage.Format.Format_ARGB32)
+  # Same format CaptureOverlay hands the editor, so painting hits the same path
+  img = QImage(w, h, QImage.Format.Format_RGB32)
   img.fill(QColor(255, 255, 255))
   return img
 
@@ -78,31 +76,34 @@ class TestDataModel:
     assert "double" in ARROW_STYLES
 
 
+@pytest.fixture(scope="class")
+def editor(tmp_path_factory):
+  """One editor per test class, for tests that only poke at its state."""
+  editor = AnnotationEditor(
+    qimage=make_test_image(),
+    save_folder=str(tmp_path_factory.mktemp("editor")),
+    on_done=MagicMock(),
+  )
+  yield editor
+  editor.close()
+
+
 # -- Compositing --------------------------------------------------------------
 
 class TestCompositing:
-  def _make_editor(self, tmp_path):
-    img = make_test_image()
-    editor = AnnotationEditor(
-      qimage=img,
-      save_folder=str(tmp_path),
-      fmt="png",
-      save_to_disk=True,
-      on_done=MagicMock(),
-    )
-    return editor
+  @pytest.fixture(autouse=True)
+  def _reset(self, editor):
+    editor._undo_stack.clear()
 
-  def test_composite_without_annotations_matches_original(self, tmp_path):
-    editor = self._make_editor(tmp_path)
+  def test_composite_without_annotations_matches_original(self, editor):
     composited = editor._composite()
     # Without annotations, the composited image should match the original
     assert composited.size() == editor._qimage.size()
+    assert composited.format() == editor._qimage.format()
     # Spot-check a pixel
     assert composited.pixelColor(50, 50) == editor._qimage.pixelColor(50, 50)
-    editor.close()
 
-  def test_composite_with_rect_differs_from_original(self, tmp_path):
-    editor = self._make_editor(tmp_path)
+  def test_composite_with_rect_differs_from_original(self, editor):
     # Add a red rectangle annotation
     ann = RectAnnotation(
       rect=QRectF(10, 10, 80, 60),
@@ -115,10 +116,8 @@ class TestCompositing:
     border_pixel = composited.pixelColor(10, 10)
     original_pixel = editor._qimage.pixelColor(10, 10)
     assert border_pixel != original_pixel
-    editor.close()
 
-  def test_composite_with_freehand_differs(self, tmp_path):
-    editor = self._make_editor(tmp_path)
+  def test_composite_with_freehand_differs(self, editor):
     ann = FreehandAnnotation(
       points=[QPointF(0, 0), QPointF(100, 100)],
       color=QColor(0, 0, 255), width=5.0,
@@ -128,23 +127,19 @@ class TestCompositing:
     # A pixel along the diagonal should be blue-ish
     px = composited.pixelColor(50, 50)
     assert px != QColor(255, 255, 255)
-    editor.close()
 
 
 # -- Undo / Redo --------------------------------------------------------------
 
 class TestUndoRedo:
-  def _make_editor(self, tmp_path):
-    img = make_test_image()
-    editor = AnnotationEditor(
-      qimage=img,
-      save_folder=str(tmp_path),
-      on_done=MagicMock(),
-    )
-    return editor
+  @pytest.fixture(autouse=True)
+  def _reset(self, editor):
+    # The editor is shared across the class; start each test with empty stacks
+    editor._undo_stack.clear()
+    editor._redo_stack.clear()
+    editor._drawing = False
 
-  def test_undo_pops_from_stack(self, tmp_path):
-    editor = self._make_editor(tmp_path)
+  def test_undo_pops_from_stack(self, editor):
     ann = RectAnnotation(QRectF(0, 0, 10, 10), QColor(255, 0, 0), 2.0)
     editor._undo_stack.append(ann)
     editor._update_undo_redo_buttons()
@@ -153,10 +148,8 @@ class TestUndoRedo:
     assert len(editor._undo_stack) == 0
     assert len(editor._redo_stack) == 1
     assert editor._redo_stack[0] is ann
-    editor.close()
 
-  def test_redo_pushes_back(self, tmp_path):
-    editor = self._make_editor(tmp_path)
+  def test_redo_pushes_back(self, editor):
     ann = RectAnnotation(QRectF(0, 0, 10, 10), QColor(255, 0, 0), 2.0)
     editor._undo_stack.append(ann)
     editor._undo()
@@ -165,10 +158,8 @@ class TestUndoRedo:
     assert len(editor._undo_stack) == 1
     assert len(editor._redo_stack) == 0
     assert editor._undo_stack[0] is ann
-    editor.close()
 
-  def test_new_annotation_clears_redo(self, tmp_path):
-    editor = self._make_editor(tmp_path)
+  def test_new_annotation_clears_redo(self, editor):
     ann1 = RectAnnotation(QRectF(0, 0, 10, 10), QColor(255, 0, 0), 2.0)
     ann2 = OvalAnnotation(QRectF(20, 20, 30, 30), QColor(0, 255, 0), 2.0)
     editor._undo_stack.append(ann1)
@@ -180,24 +171,18 @@ class TestUndoRedo:
     editor._undo_stack.append(ann2)
     editor._redo_stack.clear()
     assert len(editor._redo_stack) == 0
-    editor.close()
 
-  def test_undo_does_nothing_when_empty(self, tmp_path):
-    editor = self._make_editor(tmp_path)
+  def test_undo_does_nothing_when_empty(self, editor):
     editor._undo()  # Should not crash
     assert len(editor._undo_stack) == 0
     assert len(editor._redo_stack) == 0
-    editor.close()
 
-  def test_redo_does_nothing_when_empty(self, tmp_path):
-    editor = self._make_editor(tmp_path)
+  def test_redo_does_nothing_when_empty(self, editor):
     editor._redo()  # Should not crash
     assert len(editor._undo_stack) == 0
     assert len(editor._redo_stack) == 0
-    editor.close()
 
-  def test_undo_blocked_during_drawing(self, tmp_path):
-    editor = self._make_editor(tmp_path)
+  def test_undo_blocked_during_drawing(self, editor):
     ann = RectAnnotation(QRectF(0, 0, 10, 10), QColor(255, 0, 0), 2.0)
     editor._undo_stack.append(ann)
     editor._drawing = True  # Simulate active drag
@@ -205,23 +190,12 @@ class TestUndoRedo:
     # Should not have undone because drawing is in progress
     assert len(editor._undo_stack) == 1
     editor._drawing = False
-    editor.close()
 
 
 # -- Coordinate conversion ---------------------------------------------------
 
 class TestCoordinateConversion:
-  def _make_editor(self, tmp_path, img_w=200, img_h=150):
-    img = make_test_image(img_w, img_h)
-    editor = AnnotationEditor(
-      qimage=img,
-      save_folder=str(tmp_path),
-      on_done=MagicMock(),
-    )
-    return editor
-
-  def test_image_coords_within_bounds(self, tmp_path):
-    editor = self._make_editor(tmp_path)
+  def test_image_coords_within_bounds(self, editor):
     # The image is centered on screen; compute expected position
     ir = editor._image_rect
     # Click in the center of the image
@@ -231,17 +205,13 @@ class TestCoordinateConversion:
     # Should be approximately center of image in image-space
     assert 50 < result.x() < 150
     assert 30 < result.y() < 120
-    editor.close()
 
-  def test_image_coords_outside_returns_none(self, tmp_path):
-    editor = self._make_editor(tmp_path)
+  def test_image_coords_outside_returns_none(self, editor):
     # Click way outside the image area
     result = editor._to_image_coords(QPoint(-100, -100))
     assert result is None
-    editor.close()
 
-  def test_clamp_stays_in_bounds(self, tmp_path):
-    editor = self._make_editor(tmp_path)
+  def test_clamp_stays_in_bounds(self, editor):
     # Clamp a point far outside bounds
     result = editor._clamp_to_image(QPoint(-9999, -9999))
     assert result.x() == 0.0
@@ -250,11 +220,12 @@ class TestCoordinateConversion:
     result2 = editor._clamp_to_image(QPoint(99999, 99999))
     assert result2.x() == editor._qimage.width() - 1.0
     assert result2.y() == editor._qimage.height() - 1.0
-    editor.close()
 
   def test_scale_computed_for_small_image(self, tmp_path):
     # An image smaller than the screen should have scale <= 1.0
-    editor = self._make_editor(tmp_path, 100, 100)
+    editor = AnnotationEditor(
+      qimage=make_test_image(100, 100), save_folder=str(tmp_path), on_done=MagicMock(),
+    )
     assert editor._scale <= 1.0
     editor.close()
 
@@ -264,7 +235,7 @@ class TestCoordinateConversion:
 class TestSaveCancel:
   def test_save_calls_done_with_filepath(self, tmp_path):
     done_mock = MagicMock()
-    img = make_test_image()
+    img = make_test_image(32, 32)
     editor = AnnotationEditor(
       qimage=img, save_folder=str(tmp_path), fmt="png",
       save_to_disk=True, on_done=done_mock,
@@ -278,7 +249,7 @@ class TestSaveCancel:
 
   def test_save_clipboard_only(self, tmp_path):
     done_mock = MagicMock()
-    img = make_test_image()
+    img = make_test_image(32, 32)
     editor = AnnotationEditor(
       qimage=img, save_folder=str(tmp_path),
       save_to_disk=False, on_done=done_mock,
@@ -292,7 +263,7 @@ class TestSaveCancel:
 
   def test_cancel_calls_done_with_cancelled(self, tmp_path):
     done_mock = MagicMock()
-    img = make_test_image()
+    img = make_test_image(32, 32)
     editor = AnnotationEditor(
       qimage=img, save_folder=str(tmp_path), on_done=done_mock,
     )
@@ -303,46 +274,20 @@ class TestSaveCancel:
 # -- Tool from modifiers ------------------------------------------------------
 
 class TestToolFromModifiers:
-  def _make_editor(self, tmp_path):
-    img = make_test_image()
-    editor = AnnotationEditor(
-      qimage=img, save_folder=str(tmp_path), on_done=MagicMock(),
-    )
-    return editor
-
-  def test_shift_gives_arrow(self, tmp_path):
-    editor = self._make_editor(tmp_path)
-    tool = editor._tool_from_modifiers(Qt.KeyboardModifier.ShiftModifier)
-    assert tool == "arrow"
-    editor.close()
-
-  def test_ctrl_gives_oval(self, tmp_path):
-    editor = self._make_editor(tmp_path)
-    tool = editor._tool_from_modifiers(Qt.KeyboardModifier.ControlModifier)
-    assert tool == "oval"
-    editor.close()
-
-  def test_alt_gives_text_by_default(self, tmp_path):
-    editor = self._make_editor(tmp_path)
-    tool = editor._tool_from_modifiers(Qt.KeyboardModifier.AltModifier)
-    assert tool == "text"
-    editor.close()
-
-  def test_no_modifier_gives_toolbar_default(self, tmp_path):
-    editor = self._make_editor(tmp_path)
-    tool = editor._tool_from_modifiers(Qt.KeyboardModifier(0))
-    assert tool == "freehand"  # default toolbar selection
-    editor.close()
-
-  def test_shift_takes_priority_over_ctrl(self, tmp_path):
-    editor = self._make_editor(tmp_path)
-    mods = Qt.KeyboardModifier.ShiftModifier | Qt.KeyboardModifier.ControlModifier
-    tool = editor._tool_from_modifiers(mods)
-    assert tool == "arrow"
-    editor.close()
+  @pytest.mark.parametrize("mods, expected", [
+    (Qt.KeyboardModifier.ShiftModifier, "arrow"),
+    (Qt.KeyboardModifier.ControlModifier, "oval"),
+    (Qt.KeyboardModifier.AltModifier, "text"),
+    # No modifier: default toolbar selection
+    (Qt.KeyboardModifier(0), "freehand"),
+    # Shift takes priority over Ctrl
+    (Qt.KeyboardModifier.ShiftModifier | Qt.KeyboardModifier.ControlModifier, "arrow"),
+  ], ids=["shift", "ctrl", "alt", "none", "shift_ctrl"])
+  def test_default_modifier_tools(self, editor, mods, expected):
+    assert editor._tool_from_modifiers(mods) == expected
 
   def test_custom_modifier_tools(self, tmp_path):
-    img = make_test_image()
+    img = make_test_image(32, 32)
     custom = {"shift": "rect", "ctrl": "freehand", "alt": "arrow"}
     editor = AnnotationEditor(
       qimage=img, save_folder=str(tmp_path), on_done=MagicMock(),
@@ -354,7 +299,7 @@ class TestToolFromModifiers:
     editor.close()
 
   def test_none_tool_falls_back_to_toolbar(self, tmp_path):
-    img = make_test_image()
+    img = make_test_image(32, 32)
     custom = {"shift": "none", "ctrl": "oval", "alt": "text"}
     editor = AnnotationEditor(
       qimage=img, save_folder=str(tmp_path), on_done=MagicMock(),
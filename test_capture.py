@@ -5,10 +5,6 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 from PySide6.QtGui import QImage, QColor
-from PySide6.QtWidgets import QApplication
-
-# Need a QApplication instance for QImage operations
-app = QApplication.instance() or QApplication([])
 
 
 def make_test_image(w=100, h=100):
@@ -19,38 +15,21 @@ def make_test_image(w=100, h=100):
 
 
 class TestSave:
-  def test_saves_jpg(self, tmp_path):
+  @pytest.mark.parametrize("fmt", ["jpg", "png", "webp"])
+  def test_saves_format(self, tmp_path, fmt):
     from capture import CaptureOverlay
-    overlay = CaptureOverlay(save_folder=str(tmp_path), fmt="jpg")
-    img = make_test_image()
+    overlay = CaptureOverlay(save_folder=str(tmp_path), fmt=fmt)
+    img = make_test_image(32, 32)
     path = overlay._save(img)
     assert path is not None
-    assert path.endswith(".jpg")
+    assert path.endswith(f".{fmt}")
     assert os.path.isfile(path)
     assert os.path.getsize(path) > 0
 
-  def test_saves_png(self, tmp_path):
-    from capture import CaptureOverlay
-    overlay = CaptureOverlay(save_folder=str(tmp_path), fmt="png")
-    img = make_test_image()
-    path = overlay._save(img)
-    assert path is not None
-    assert path.endswith(".png")
-    assert os.path.isfile(path)
-
-  def test_saves_webp(self, tmp_path):
-    from capture import CaptureOverlay
-    overlay = CaptureOverlay(save_folder=str(tmp_path), fmt="webp")
-    img = make_test_image()
-    path = overlay._save(img)
-    assert path is not None
-    assert path.endswith(".webp")
-    assert os.path.isfile(path)
-
   def test_custom_prefix(self, tmp_path):
     from capture import CaptureOverlay
     overlay = CaptureOverlay(save_folder=str(tmp_path), filename_prefix="test_shot")
-    img = make_test_image()
+    img = make_test_image(32, 32)
     path = overlay._save(img)
     assert "test_shot_" in os.path.basename(path)
 
@@ -60,7 +39,7 @@ class TestSave:
       save_folder=str(tmp_path), fmt="png",
       filename_suffix="%Y-%m-%d_%H-%M-%S",
     )
-    img = make_test_image()
+    img = make_test_image(32, 32)
     path = overlay._save(img)
     assert path is not None
     # Should NOT contain milliseconds (old format had _NNN at end)
@@ -71,7 +50,7 @@ class TestSave:
 
   def test_collision_avoidance(self, tmp_path):
     from platform_utils import save_qimage
-    img = make_test_image()
+    img = make_test_image(32, 32)
     # Use a fixed suffix so both calls produce the same base name
     p1 = save_qimage(img, str(tmp_path), "png", "dup", "fixed")
     p2 = save_qimage(img, str(tmp_path), "png", "dup", "fixed")
@@ -85,7 +64,7 @@ class TestSave:
     from capture import CaptureOverlay
     nested = str(tmp_path / "sub" / "dir")
     overlay = CaptureOverlay(save_folder=nested)
-    img = make_test_image()
+    img = make_test_image(32, 32)
     path = overlay._save(img)
     assert path is not None
     assert os.path.isfile(path)
@@ -98,12 +77,87 @@ class TestSave:
     else:
       bad_folder = "/dev/null/impossible"
     overlay = CaptureOverlay(save_folder=bad_folder)
-    img = make_test_image()
+    img = make_test_image(32, 32)
     path = overlay._save(img)
     assert path is None
 
 
+class TestCrop:
+  def test_partial_rect_copies_region(self):
+    from PySide6.QtCore import QRect
+    from capture import CaptureOverlay
+    overlay = CaptureOverlay(save_folder="/tmp")
+    overlay.screenshot_qimage = make_test_image(200, 100)
+    cropped = overlay._crop(QRect(10, 20, 50, 30))
+    assert (cropped.width(), cropped.height()) == (50, 30)
+    assert cropped.cacheKey() != overlay.screenshot_qimage.cacheKey()
+
+  def test_full_rect_shares_screenshot(self):
+    from capture import CaptureOverlay
+    overlay = CaptureOverlay(save_folder="/tmp")
+    overlay.screenshot_qimage = make_test_image(200, 100)
+    cropped = overlay._crop(overlay.screenshot_qimage.rect())
+    assert cropped.cacheKey() == overlay.screenshot_qimage.cacheKey()
+
+  def test_rect_clipped_to_screenshot(self):
+    from PySide6.QtCore import QRect
+    from capture import CaptureOverlay
+    overlay = CaptureOverlay(save_folder="/tmp")
+    overlay.screenshot_qimage = make_test_image(200, 100)
+    cropped = overlay._crop(QRect(150, 50, 100, 100))
+    assert (cropped.width(), cropped.height()) == (50, 50)
+
+
+class TestWindowHighlight:
+  def _make_overlay(self):
+    from capture import CaptureOverlay
+    overlay = CaptureOverlay(save_folder="/tmp", mode="window")
+    overlay.screenshot_qimage = make_test_image(400, 300)
+    overlay.screen_left = overlay.screen_top = 0
+    return overlay
+
+  def test_windows_enumerated_once_per_overlay(self):
+    from PySide6.QtCore import QPoint, QRect
+    overlay = self._make_overlay()
+    # Topmost first: a small window stacked above a larger one
+    rects = [(10, 10, 60, 60), (0, 0, 200, 200)]
+    with patch("window_utils.get_window_rects", return_value=rects) as get_rects, \
+         patch("window_utils.get_cursor_pos", side_effect=[(20, 20), (100, 100)]):
+      overlay._update_window_highlight(QPoint())
+      assert overlay.highlight_rect == QRect(10, 10, 50, 50)
+      overlay._update_window_highlight(QPoint())
+      assert overlay.highlight_rect == QRect(0, 0, 200, 200)
+    get_rects.assert_called_once()
+
+  def test_no_window_clears_highlight(self):
+    from PySide6.QtCore import QPoint, QRect
+    overlay = self._make_overlay()
+    overlay.highlight_rect = QRect(0, 0, 10, 10)
+    with patch("window_utils.get_window_rects", return_value=[(0, 0, 50, 50)]), \
+         patch("window_utils.get_cursor_pos", return_value=(300, 250)):
+      overlay._update_window_highlight(QPoint())
+    assert overlay.highlight_rect is None
+
+  def test_highlight_change_repaints_only_old_and_new_area(self):
+    from PySide6.QtCore import QPoint, QRect
+    overlay = self._make_overlay()
+    overlay.highlight_rect = QRect(0, 0, 10, 10)
+    with patch("window_utils.get_window_rects", return_value=[(100, 100, 150, 150)]), \
+         patch("window_utils.get_cursor_pos", return_value=(120, 120)), \
+         patch.object(overlay, "update") as update:
+      overlay._update_window_highlight(QPoint())
+    dirty = update.call_args.args[0]
+    assert dirty.contains(overlay._highlight_bounds(QRect(0, 0, 10, 10)))
+    assert dirty.contains(overlay._highlight_bounds(QRect(100, 100, 50, 50)))
+    assert not dirty.contains(QRect(0, 0, 400, 300))
+
+
 class TestFinishCapture:
+  @pytest.fixture(autouse=True)
+  def _no_close(self, monkeypatch):
+    # The overlay is never shown in these tests; don't let close() run
+    monkeypatch.setattr("capture.CaptureOverlay.close", lambda self: None)
+
   def test_callback_receives_filepath(self, tmp_path):
     from capture import CaptureOverlay
     results = {}
@@ -118,8 +172,7 @@ class TestFinishCapture:
     )
     img = make_test_image()
 
-    with patch.object(overlay, "close"):
-      overlay._finish_capture(img)
+    overlay._finish_capture(img)
 
     assert results["filepath"] is not None
     assert results["error"] is None
@@ -138,8 +191,7 @@ class TestFinishCapture:
     )
     img = make_test_image()
 
-    with patch.object(overlay, "close"):
-      overlay._finish_capture(img)
+    overlay._finish_capture(img)
 
     assert results["filepath"] is None
     assert results["error"] is None
@@ -157,13 +209,42 @@ class TestFinishCapture:
     )
     img = make_test_image()
 
-    with patch.object(overlay, "close"), \
-         patch("capture.copy_image_to_clipboard", return_value=False):
+    with patch("capture.copy_image_to_clipboard", return_value=False):
       overlay._finish_capture(img)
 
     assert results["error"] is not None
     assert "clipboard" in results["error"].lower()
 
+  def test_save_runs_off_main_thread(self, tmp_path):
+    import threading
+    from capture import CaptureOverlay
+    from platform_utils import save_qimage
+    results = {}
+    save_threads = []
+
+    def on_done(filepath, error=None):
+      results["filepath"] = filepath
+      results["error"] = error
+
+    def recording_save(*args, **kwargs):
+      save_threads.append(threading.current_thread())
+      return save_qimage(*args, **kwargs)
+
+    overlay = CaptureOverlay(
+      save_folder=str(tmp_path), fmt="png",
+      save_to_disk=True, on_done=on_done,
+    )
+    img = make_test_image()
+
+    with patch("capture.save_qimage", side_effect=recording_save):
+      overlay._finish_capture(img)
+
+    assert len(save_threads) == 1
+    assert save_threads[0] is not threading.main_thread()
+    # Save is joined before on_done, so the path is still reported
+    assert results["filepath"] is not None
+    assert os.path.isfile(results["filepath"])
+
   def test_cancel_calls_done_with_cancelled(self):
     from capture import CaptureOverlay
     results = {}
@@ -174,8 +255,7 @@ class TestFinishCapture:
 
     overlay = CaptureOverlay(save_folder="/tmp", on_done=on_done)
 
-    with patch.object(overlay, "close"):
-      overlay._cancel()
+    overlay._cancel()
 
     assert results["filepath"] is None
     assert results["error"] == "cancelled"
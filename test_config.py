@@ -8,14 +8,6 @@ import pytest
 import main
 
 
-@pytest.fixture
-def config_file(tmp_path, monkeypatch):
-  """Redirect config I/O to a temp directory."""
-  path = tmp_path / "config.json"
-  monkeypatch.setattr(main, "CONFIG_PATH", str(path))
-  return path
-
-
 class TestLoadConfig:
   def test_creates_default_when_missing(self, config_file):
     assert not config_file.exists()
@@ -40,6 +32,23 @@ class TestLoadConfig:
     restored = json.loads(config_file.read_text())
     assert restored["format"] == "png"
 
+  def test_unchanged_file_served_from_cache(self, config_file, monkeypatch):
+    main.save_config(dict(main.DEFAULT_CONFIG))
+    monkeypatch.setattr(main.json, "loads", lambda *a: pytest.fail("re-parsed"))
+    cfg = main.load_config()
+    assert cfg == main.DEFAULT_CONFIG
+    # Callers get their own copy
+    cfg["format"] = "jpg"
+    assert main.load_config()["format"] == "png"
+
+  def test_external_edit_invalidates_cache(self, config_file):
+    main.save_config(dict(main.DEFAULT_CONFIG))
+    edited = dict(main.DEFAULT_CONFIG, format="webp")
+    config_file.write_text(json.dumps(edited))
+    st = os.stat(config_file)
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert main.load_config()["format"] == "webp"
+
   def test_returns_defaults_on_read_error(self, config_file, monkeypatch):
     # Point to a path that exists but can't be read (directory)
     monkeypatch.setattr(main, "CONFIG_PATH", str(config_file.parent))
@@ -53,6 +62,20 @@ class TestSaveConfig:
     data = json.loads(config_file.read_text())
     assert data["format"] == "webp"
 
+  def test_identical_config_not_rewritten(self, config_file, monkeypatch):
+    main.save_config({"format": "png"})
+    monkeypatch.setattr(main.os, "replace", lambda *a: pytest.fail("rewritten"))
+    main.save_config({"format": "png"})
+
+  def test_failed_replace_keeps_old_config(self, config_file, monkeypatch):
+    main.save_config({"format": "png"})
+    def fail_replace(src, dst):
+      raise OSError("disk full")
+    monkeypatch.setattr(main.os, "replace", fail_replace)
+    main.save_config({"format": "jpg"})
+    assert json.loads(config_file.read_text())["format"] == "png"
+    assert not os.path.exists(str(config_file) + ".tmp")
+
   def test_handles_write_error_gracefully(self, config_file, monkeypatch):
     # Point to an invalid path
     monkeypatch.setattr(main, "CONFIG_PATH", str(config_file.parent / "no" / "such" / "dir" / "config.json"))
@@ -69,3 +92,7 @@ class TestDefaultConfig:
     ]
     for key in required:
       assert key in main.DEFAULT_CONFIG, f"Missing key: {key}"
+
+  def test_is_read_only(self):
+    with pytest.raises(TypeError):
+      main.DEFAULT_CONFIG["format"] = "jpg"
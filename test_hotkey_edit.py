@@ -1,49 +1,71 @@
-"""Tests for HotkeyEdit key-to-pynput conversion."""
+"""Tests for HotkeyEdit key-to-pynput conversion and hotkey display formatting."""
 
+import pytest
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication
 
-app = QApplication.instance() or QApplication([])
+from main import HotkeyEdit, format_hotkey_display
 
-from main import HotkeyEdit
+
+KEY_TO_PYNPUT_CASES = [
+  # Letters and digits
+  (Qt.Key.Key_A, "a"),
+  (Qt.Key.Key_Z, "z"),
+  (Qt.Key.Key_M, "m"),
+  (Qt.Key.Key_0, "0"),
+  (Qt.Key.Key_9, "9"),
+  (Qt.Key.Key_5, "5"),
+  # Function keys
+  (Qt.Key.Key_F1, "<f1>"),
+  (Qt.Key.Key_F5, "<f5>"),
+  (Qt.Key.Key_F12, "<f12>"),
+  # Special keys
+  (Qt.Key.Key_Space, "<space>"),
+  (Qt.Key.Key_Tab, "<tab>"),
+  (Qt.Key.Key_Return, "<enter>"),
+  (Qt.Key.Key_Enter, "<enter>"),
+  (Qt.Key.Key_Backspace, "<backspace>"),
+  (Qt.Key.Key_Delete, "<delete>"),
+  # Navigation and arrows
+  (Qt.Key.Key_Home, "<home>"),
+  (Qt.Key.Key_End, "<end>"),
+  (Qt.Key.Key_PageUp, "<page_up>"),
+  (Qt.Key.Key_PageDown, "<page_down>"),
+  (Qt.Key.Key_Up, "<up>"),
+  (Qt.Key.Key_Down, "<down>"),
+  (Qt.Key.Key_Left, "<left>"),
+  (Qt.Key.Key_Right, "<right>"),
+  # Key_Pause is not in the mapping
+  (Qt.Key.Key_Pause, None),
+]
 
 
 class TestKeyToPynput:
-  def test_letters(self):
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_A) == "a"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Z) == "z"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_M) == "m"
-
-  def test_digits(self):
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_0) == "0"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_9) == "9"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_5) == "5"
-
-  def test_function_keys(self):
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_F1) == "<f1>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_F5) == "<f5>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_F12) == "<f12>"
-
-  def test_special_keys(self):
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Space) == "<space>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Tab) == "<tab>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Return) == "<enter>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Enter) == "<enter>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Backspace) == "<backspace>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Delete) == "<delete>"
-
-  def test_navigation_keys(self):
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Home) == "<home>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_End) == "<end>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_PageUp) == "<page_up>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_PageDown) == "<page_down>"
-
-  def test_arrow_keys(self):
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Up) == "<up>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Down) == "<down>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Left) == "<left>"
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Right) == "<right>"
-
-  def test_unmapped_key_returns_none(self):
-    # Key_Pause is not in the mapping
-    assert HotkeyEdit._key_to_pynput(Qt.Key.Key_Pause) is None
+  @pytest.mark.parametrize(
+    "key, expected", KEY_TO_PYNPUT_CASES,
+    ids=[k.name for k, _ in KEY_TO_PYNPUT_CASES],
+  )
+  def test_key_to_pynput(self, key, expected):
+    assert HotkeyEdit._key_to_pynput(key) == expected
+
+
+class TestFormatHotkeyDisplay:
+  def test_modifiers_and_letter(self):
+    assert format_hotkey_display("<ctrl>+<alt>+<shift>+s") == "Ctrl + Alt + Shift + S"
+
+  def test_special_keys_capitalized(self):
+    assert format_hotkey_display("<cmd>+<f5>") == "Cmd + F5"
+    assert format_hotkey_display("<alt>+<page_up>") == "Alt + Page_up"
+
+  def test_empty_string(self):
+    assert format_hotkey_display("") == ""
+
+
+class TestRecordingStyle:
+  def test_recording_toggles_property_not_stylesheet(self):
+    edit = HotkeyEdit("<ctrl>+<alt>+s")
+    sheet = edit.styleSheet()
+    edit._set_recording(True)
+    assert edit.property("recording") is True
+    edit._set_recording(False)
+    assert edit.property("recording") is False
+    assert edit.styleSheet() == sheet
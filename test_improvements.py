@@ -8,9 +8,6 @@ from unittest.mock import patch, MagicMock, PropertyMock
 
 import pytest
 from PySide6.QtCore import QTimer
-from PySide6.QtWidgets import QApplication
-
-app = QApplication.instance() or QApplication([])
 
 import main
 from main import (
@@ -58,6 +55,13 @@ class TestLockFileTimeout:
     finally:
       lock.close()
 
+  def test_heartbeat_refreshes_timestamp(self, config_file):
+    import io
+    lock_file = io.StringIO(str(time.time() - LOCK_TIMEOUT_SECONDS - 100))
+    ip = ImmediPaste(lock_file=lock_file)
+    ip._refresh_lock()
+    assert time.time() - float(lock_file.getvalue()) < LOCK_TIMEOUT_SECONDS
+
   def test_stale_lock_is_broken(self, tmp_path, monkeypatch):
     """Lock is held but timestamp is stale -- should break and reacquire."""
     self._patch_tempdir(monkeypatch, tmp_path)
@@ -121,8 +125,7 @@ class TestLockFileTimeout:
 # -- Config save debounce ----------------------------------------------------
 
 class TestSettingsDebounce:
-  def test_debounce_timer_exists(self, tmp_path, monkeypatch):
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
+  def test_debounce_timer_exists(self, config_file, tmp_path):
     config = dict(main.DEFAULT_CONFIG)
     config["save_folder"] = str(tmp_path)
     dialog = SettingsDialog(config)
@@ -131,8 +134,7 @@ class TestSettingsDebounce:
     assert dialog._save_timer.isSingleShot()
     assert dialog._save_timer.interval() == SAVE_DEBOUNCE_MS
 
-  def test_emit_change_starts_timer(self, tmp_path, monkeypatch):
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
+  def test_emit_change_starts_timer(self, config_file, tmp_path):
     config = dict(main.DEFAULT_CONFIG)
     config["save_folder"] = str(tmp_path)
     called = []
@@ -142,8 +144,7 @@ class TestSettingsDebounce:
     assert dialog._save_timer.isActive()
     assert len(called) == 0
 
-  def test_flush_change_calls_on_change(self, tmp_path, monkeypatch):
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
+  def test_flush_change_calls_on_change(self, config_file, tmp_path):
     config = dict(main.DEFAULT_CONFIG)
     config["save_folder"] = str(tmp_path)
     called = []
@@ -152,8 +153,7 @@ class TestSettingsDebounce:
     assert len(called) == 1
     assert "save_folder" in called[0]
 
-  def test_done_flushes_pending_timer(self, tmp_path, monkeypatch):
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
+  def test_done_flushes_pending_timer(self, config_file, tmp_path):
     config = dict(main.DEFAULT_CONFIG)
     config["save_folder"] = str(tmp_path)
     called = []
@@ -167,8 +167,7 @@ class TestSettingsDebounce:
     assert not dialog._save_timer.isActive()
     assert len(called) == 1
 
-  def test_done_noop_when_no_pending_timer(self, tmp_path, monkeypatch):
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
+  def test_done_noop_when_no_pending_timer(self, config_file, tmp_path):
     config = dict(main.DEFAULT_CONFIG)
     config["save_folder"] = str(tmp_path)
     called = []
@@ -177,55 +176,158 @@ class TestSettingsDebounce:
     dialog.done(0)
     assert len(called) == 0
 
-
-# -- Save folder validation --------------------------------------------------
-
-class TestFolderValidation:
-  def test_valid_folder_no_warning(self, tmp_path, monkeypatch):
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
+  def test_set_config_refreshes_without_emitting(self, config_file, tmp_path):
     config = dict(main.DEFAULT_CONFIG)
     config["save_folder"] = str(tmp_path)
-    dialog = SettingsDialog(config)
-    dialog.folder_edit.setText(str(tmp_path))
-    dialog._validate_folder()
-    assert dialog.folder_warning.isHidden()
+    called = []
+    dialog = SettingsDialog(config, on_change=lambda c: called.append(c))
+    updated = dict(config, format="webp", hotkey_region="<ctrl>+<alt>+r",
+                   annotate_captures=True, annotate_shift_tool="rect")
+    dialog.set_config(updated)
+    assert not dialog._save_timer.isActive()
+    assert called == []
+    got = dialog.get_config()
+    assert got == {k: updated[k] for k in got}
 
-  def test_nonexistent_folder_shows_warning(self, tmp_path, monkeypatch):
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
+  def test_open_settings_reuses_dialog(self, config_file, tmp_path):
     config = dict(main.DEFAULT_CONFIG)
-    bad_path = str(tmp_path / "no" / "such" / "deep" / "path")
-    config["save_folder"] = bad_path
-    dialog = SettingsDialog(config)
-    dialog.folder_edit.setText(bad_path)
-    dialog._validate_folder()
-    assert not dialog.folder_warning.isHidden()
-    assert "cannot be created" in dialog.folder_warning.text().lower()
+    config["save_folder"] = str(tmp_path)
+    main.save_config(config)
+    ip = ImmediPaste()
+    ip._listener = MagicMock()
+    mock_dialog = MagicMock()
+    with patch("main.SettingsDialog", return_value=mock_dialog) as mock_cls, \
+         patch.object(ip, "_start_hotkey_listener"):
+      ip.open_settings()
+      ip.open_settings()
+    mock_cls.assert_called_once()
+    mock_dialog.set_config.assert_called_once_with(ip.config)
+    assert mock_dialog.exec.call_count == 2
+
+
+@pytest.fixture
+def app(config_file, tmp_path):
+  """ImmediPaste started from a default config saved to config_file."""
+  config = dict(main.DEFAULT_CONFIG)
+  config["save_folder"] = str(tmp_path)
+  main.save_config(config)
+  return ImmediPaste()
+
+
+class TestConfigWriteCoalescing:
+  def _saved_config(self, config_file):
+    return json.loads(config_file.read_text())
+
+  def test_change_schedules_single_write(self, app, config_file):
+    app._apply_settings({"format": "jpg"})
+    app._apply_settings({"filename_prefix": "shot"})
+    assert app._config_write_timer.isActive()
+    # Nothing written until the timer fires
+    assert self._saved_config(config_file)["format"] == "png"
+    app._write_config()
+    saved = self._saved_config(config_file)
+    assert saved["format"] == "jpg"
+    assert saved["filename_prefix"] == "shot"
+
+  def test_unchanged_config_skips_write(self, app):
+    kwargs = app._capture_kwargs
+    with patch("main.set_launch_on_startup") as mock_startup:
+      app._apply_settings(dict(app.config))
+    assert not app._config_write_timer.isActive()
+    # Early return: nothing rebuilt, startup registry untouched
+    assert app._capture_kwargs is kwargs
+    mock_startup.assert_not_called()
+
+  def test_reverted_change_not_rewritten(self, app, config_file, monkeypatch):
+    app._apply_settings({"format": "jpg"})
+    app._apply_settings({"format": "png"})
+    # Same bytes as the file on disk: save_config() turns the write into a no-op
+    monkeypatch.setattr(main.os, "replace", lambda *a: pytest.fail("rewritten"))
+    app._write_config()
+    assert self._saved_config(config_file)["format"] == "png"
+
+  def test_shutdown_flushes_pending_write(self, app, config_file):
+    app._listener = MagicMock()
+    app._apply_settings({"format": "webp"})
+    app._shutdown()
+    assert not app._config_write_timer.isActive()
+    assert self._saved_config(config_file)["format"] == "webp"
+
+
+class TestConfigHotReload:
+  def _edit_config(self, config_file, text):
+    config_file.write_text(text)
+    # Make sure the stat key changes even on coarse-mtime filesystems
+    st = os.stat(config_file)
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+  def test_external_edit_applied(self, app, config_file):
+    edited = dict(app.config, format="webp")
+    self._edit_config(config_file, json.dumps(edited, indent=2))
+    with patch.object(app, "reload_settings") as mock_reload:
+      app._check_config_file()
+    assert app.config["format"] == "webp"
+    assert app._capture_kwargs["fmt"] == "webp"
+    mock_reload.assert_called_once()
+    # The file already holds this config; it is not rewritten
+    assert not app._config_write_timer.isActive()
+
+  def test_unreadable_edit_ignored(self, app, config_file):
+    self._edit_config(config_file, '{"format": "webp",')
+    with patch.object(app, "reload_settings") as mock_reload:
+      app._check_config_file()
+    assert app.config["format"] == "png"
+    mock_reload.assert_not_called()
+    # The half-written file is left for the user to finish, not reset
+    assert config_file.read_text() == '{"format": "webp",'
+
+  def test_own_write_not_reloaded(self, app):
+    app._apply_settings({"format": "jpg"})
+    app._write_config()
+    with patch.object(app, "_apply_settings") as mock_apply:
+      app._check_config_file()
+    mock_apply.assert_not_called()
 
-  def test_creatable_folder_no_warning(self, tmp_path, monkeypatch):
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
-    config = dict(main.DEFAULT_CONFIG)
+
+# -- Save folder validation --------------------------------------------------
+
+@pytest.fixture(scope="class")
+def dialog():
+  """One SettingsDialog per test class; it never reads or writes CONFIG_PATH."""
+  dialog = SettingsDialog(dict(main.DEFAULT_CONFIG))
+  yield dialog
+  dialog.close()
+
+
+class TestFolderValidation:
+  @pytest.fixture(autouse=True)
+  def _reset(self, dialog):
+    dialog.set_config(dict(main.DEFAULT_CONFIG))
+
+  @pytest.mark.parametrize("sub, should_warn", [
+    (".", False),
     # Parent exists, child doesn't -- folder can be created on capture
-    new_folder = str(tmp_path / "new_sub")
-    config["save_folder"] = new_folder
-    dialog = SettingsDialog(config)
-    dialog.folder_edit.setText(new_folder)
+    ("new_sub", False),
+    ("no/such/deep/path", True),
+    # Empty field: no folder to check
+    (None, False),
+  ], ids=["existing", "creatable", "nonexistent", "empty"])
+  def test_folder_warning(self, dialog, tmp_path, sub, should_warn):
+    dialog.folder_edit.setText("" if sub is None else str(tmp_path / sub))
     dialog._validate_folder()
-    assert dialog.folder_warning.isHidden()
+    assert dialog.folder_warning.isHidden() is not should_warn
+    if should_warn:
+      assert "cannot be created" in dialog.folder_warning.text().lower()
 
-  def test_empty_folder_no_warning(self, tmp_path, monkeypatch):
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
-    config = dict(main.DEFAULT_CONFIG)
-    config["save_folder"] = ""
-    dialog = SettingsDialog(config)
-    dialog.folder_edit.setText("")
+  def test_validation_cached_per_path(self, dialog, tmp_path):
+    dialog.folder_edit.setText(str(tmp_path))
     dialog._validate_folder()
+    with patch("main.os.path.isdir") as mock_isdir:
+      dialog._validate_folder()
+    mock_isdir.assert_not_called()
     assert dialog.folder_warning.isHidden()
 
-  def test_relative_path_resolves_correctly(self, tmp_path, monkeypatch):
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
-    config = dict(main.DEFAULT_CONFIG)
-    config["save_folder"] = str(tmp_path)
-    dialog = SettingsDialog(config)
+  def test_relative_path_resolves_correctly(self, dialog):
     # A bare name like "screenshots" should resolve relative to cwd
     # and not crash on os.path.dirname returning ""
     dialog.folder_edit.setText("screenshots")
@@ -289,6 +391,113 @@ class TestListenerErrorHandling:
     # Should not raise even if stop fails
     ip.reload_settings()
 
+  def test_reload_skips_restart_when_hotkeys_unchanged(self, tmp_path, monkeypatch):
+    ip = self._make_app(tmp_path, monkeypatch)
+    ip.hotkey_bridge = main.HotkeyBridge()
+    native = MagicMock()
+    with patch("main.NativeHotkeyListener", return_value=native):
+      ip._start_hotkey_listener()
+      ip.reload_settings()
+      native.stop.assert_not_called()
+      ip.config["hotkey_region"] = "<ctrl>+<alt>+r"
+      ip.reload_settings()
+    native.stop.assert_called_once()
+    assert native.start.call_count == 2
+
+  def test_native_hotkeys_preferred(self, tmp_path, monkeypatch):
+    ip = self._make_app(tmp_path, monkeypatch)
+    ip.hotkey_bridge = main.HotkeyBridge()
+    native = MagicMock()
+    with patch("main.NativeHotkeyListener", return_value=native) as mock_cls, \
+         patch("pynput.keyboard.Listener") as mock_pynput:
+      ip._start_hotkey_listener()
+    bindings = mock_cls.call_args[0][0]
+    assert [b[:2] for b in bindings] == [
+      main.parse_native_hotkey(ip.config[k]) for k in main._HOTKEY_CONFIG_KEYS
+    ]
+    native.start.assert_called_once()
+    mock_pynput.assert_not_called()
+    assert ip._listener is native
+
+  def test_native_registration_failure_falls_back(self, tmp_path, monkeypatch):
+    ip = self._make_app(tmp_path, monkeypatch)
+    ip.hotkey_bridge = main.HotkeyBridge()
+    native = MagicMock()
+    native.start.side_effect = OSError("hotkey already registered")
+    with patch("main.NativeHotkeyListener", return_value=native), \
+         patch("pynput.keyboard.HotKey.parse", side_effect=lambda s: [s]), \
+         patch("pynput.keyboard.Listener") as mock_pynput:
+      ip._start_hotkey_listener()
+    mock_pynput.return_value.start.assert_called_once()
+    assert ip._listener is mock_pynput.return_value
+
+  def test_pynput_dispatch_table(self, tmp_path, monkeypatch):
+    ip = self._make_app(tmp_path, monkeypatch)
+    ip.hotkey_bridge = main.HotkeyBridge()
+    fired = []
+    ip.hotkey_bridge.region_triggered.connect(lambda: fired.append("region"))
+    ip.hotkey_bridge.window_triggered.connect(lambda: fired.append("window"))
+    with patch("main.NativeHotkeyListener", None), \
+         patch("pynput.keyboard.HotKey.parse", side_effect=lambda s: s.split("+")), \
+         patch("pynput.keyboard.Listener") as mock_pynput:
+      ip._start_hotkey_listener()
+    ip._listener.canonical = MagicMock(side_effect=lambda k: k)
+    on_press = mock_pynput.call_args.kwargs["on_press"]
+    on_release = mock_pynput.call_args.kwargs["on_release"]
+
+    for key in ("<ctrl>", "x", "<alt>", "<shift>", "s"):  # x is not tracked
+      on_press(key)
+    on_press("s")  # auto-repeat
+    assert fired == ["region"]
+    on_release("s")
+    on_press("d")
+    assert fired == ["region", "window"]
+    # Canonical form is computed once per distinct physical key
+    assert ip._listener.canonical.call_count == 6
+
+  def test_parsed_hotkeys_reused_until_changed(self, tmp_path, monkeypatch):
+    ip = self._make_app(tmp_path, monkeypatch)
+    region = ip.config["hotkey_region"]
+    with patch("pynput.keyboard.HotKey.parse", side_effect=lambda s: [s]) as mock_parse:
+      first = ip._parse_hotkey_keys(region)
+      assert ip._parse_hotkey_keys(region) is first
+      assert mock_parse.call_count == 1
+      ip._apply_settings({"hotkey_region": "<ctrl>+<alt>+r"})
+      assert region not in ip._parsed_hotkeys
+
+
+# -- Show in Explorer ---------------------------------------------------------
+
+class TestShowInExplorer:
+  def test_windows_uses_shell_api(self, monkeypatch):
+    monkeypatch.setattr("main.IS_WINDOWS", True)
+    select = MagicMock(return_value=True)
+    with patch("main.select_in_explorer", select), patch("subprocess.Popen") as mock_popen:
+      main.ImmediPaste._reveal_file("C:/shots/a.png")
+    select.assert_called_once_with("C:/shots/a.png")
+    mock_popen.assert_not_called()
+
+  def test_windows_falls_back_to_explorer(self, monkeypatch):
+    monkeypatch.setattr("main.IS_WINDOWS", True)
+    with patch("main.select_in_explorer", return_value=False), \
+         patch("subprocess.Popen") as mock_popen:
+      main.ImmediPaste._reveal_file("C:/shots/a.png")
+    assert mock_popen.call_args[0][0][:2] == ["explorer", "/select,"]
+
+  def test_runs_off_main_thread(self):
+    import threading
+    threads = []
+    done = threading.Event()
+
+    def record(path):
+      threads.append(threading.current_thread())
+      done.set()
+
+    with patch.object(main.ImmediPaste, "_reveal_file", side_effect=record):
+      main.ImmediPaste._show_in_explorer("/shots/a.png")
+      assert done.wait(5)
+    assert threads[0] is not threading.main_thread()
+
 
 # -- Tray icon constants ------------------------------------------------------
 
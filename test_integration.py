@@ -1,14 +1,13 @@
-"""Integration tests for the capture pipeline and config migration."""
+"""Integration tests for the capture pipeline, tray menu, and config migration."""
 
 import json
 import os
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 import pytest
 from PySide6.QtGui import QImage, QColor
-from PySide6.QtWidgets import QApplication, QSystemTrayIcon
-
-app = QApplication.instance() or QApplication([])
+from PySide6.QtWidgets import QApplication, QMenu, QSystemTrayIcon
 
 import main
 from main import ImmediPaste, migrate_config, CONFIG_VERSION
@@ -16,6 +15,23 @@ from main import ImmediPaste, migrate_config, CONFIG_VERSION
 
 # -- Integration: trigger -> overlay -> callback ----------------------------
 
+class FakeMss:
+  """Stand-in for mss.mss(): a single monitor that grabs a blank frame."""
+
+  def __init__(self, width, height):
+    self.monitors = [{"left": 0, "top": 0, "width": width, "height": height}]
+    self._shot = SimpleNamespace(raw=bytearray(width * height * 4), width=width, height=height)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    return False
+
+  def grab(self, monitor):
+    return self._shot
+
+
 class TestCapturePipeline:
   """Test the full trigger -> CaptureOverlay -> _on_capture_done wiring."""
 
@@ -37,18 +53,8 @@ class TestCapturePipeline:
     fake_img = QImage(200, 150, QImage.Format.Format_ARGB32)
     fake_img.fill(QColor(0, 128, 255))
 
-    with patch("capture.mss.mss") as mock_mss, \
+    with patch("capture.mss.mss", return_value=FakeMss(200, 150)), \
          patch("capture.copy_image_to_clipboard", return_value=True):
-      ctx = MagicMock()
-      ctx.monitors = [{"left": 0, "top": 0, "width": 200, "height": 150}]
-      grab_result = MagicMock()
-      grab_result.bgra = bytes(200 * 150 * 4)
-      grab_result.width = 200
-      grab_result.height = 150
-      ctx.grab.return_value = grab_result
-      mock_mss.return_value.__enter__ = lambda s: ctx
-      mock_mss.return_value.__exit__ = MagicMock(return_value=False)
-
       ip.trigger_fullscreen()
 
     # Should no longer be capturing
@@ -61,20 +67,10 @@ class TestCapturePipeline:
 
   def test_fullscreen_capture_clipboard_only(self, tmp_path, monkeypatch):
     ip = self._make_app(tmp_path, monkeypatch)
-    ip.config["save_to_disk"] = False
+    ip._apply_settings({"save_to_disk": False})
 
-    with patch("capture.mss.mss") as mock_mss, \
+    with patch("capture.mss.mss", return_value=FakeMss(100, 100)), \
          patch("capture.copy_image_to_clipboard", return_value=True):
-      ctx = MagicMock()
-      ctx.monitors = [{"left": 0, "top": 0, "width": 100, "height": 100}]
-      grab_result = MagicMock()
-      grab_result.bgra = bytes(100 * 100 * 4)
-      grab_result.width = 100
-      grab_result.height = 100
-      ctx.grab.return_value = grab_result
-      mock_mss.return_value.__enter__ = lambda s: ctx
-      mock_mss.return_value.__exit__ = MagicMock(return_value=False)
-
       ip.trigger_fullscreen()
 
     assert ip.capturing is False
@@ -108,10 +104,12 @@ class TestCapturePipeline:
 
   def test_capture_history_limited(self, tmp_path, monkeypatch):
     ip = self._make_app(tmp_path, monkeypatch)
-    # Simulate many captures
-    for i in range(10):
+    # Simulate more captures than the history holds
+    count = main.MAX_HISTORY + 5
+    for i in range(count):
       ip._on_capture_done(f"/tmp/shot_{i}.png")
     assert len(ip.capture_history) == main.MAX_HISTORY
+    assert ip.capture_history[-1] == f"/tmp/shot_{count - 1}.png"
 
   def test_error_callback_shows_critical_notification(self, tmp_path, monkeypatch):
     ip = self._make_app(tmp_path, monkeypatch)
@@ -122,7 +120,7 @@ class TestCapturePipeline:
 
   def test_window_capture_blocked_on_non_windows(self, tmp_path, monkeypatch):
     ip = self._make_app(tmp_path, monkeypatch)
-    monkeypatch.setattr("main.platform.system", lambda: "Linux")
+    monkeypatch.setattr("main.IS_WINDOWS", False)
     ip.trigger_window_capture()
     assert ip.capturing is False  # never entered capturing state
     ip.tray_icon.showMessage.assert_called_once()
@@ -195,18 +193,8 @@ class TestCapturePipeline:
       on_image_ready=on_image_ready,
     )
 
-    with patch("capture.mss.mss") as mock_mss, \
+    with patch("capture.mss.mss", return_value=FakeMss(100, 100)), \
          patch("capture.copy_image_to_clipboard") as mock_clip:
-      ctx = MagicMock()
-      ctx.monitors = [{"left": 0, "top": 0, "width": 100, "height": 100}]
-      grab_result = MagicMock()
-      grab_result.bgra = bytes(100 * 100 * 4)
-      grab_result.width = 100
-      grab_result.height = 100
-      ctx.grab.return_value = grab_result
-      mock_mss.return_value.__enter__ = lambda s: ctx
-      mock_mss.return_value.__exit__ = MagicMock(return_value=False)
-
       overlay.capture_fullscreen_direct()
 
     assert "qimage" in received
@@ -228,6 +216,58 @@ class TestCapturePipeline:
     assert cb is None
 
 
+# -- Tray menu ---------------------------------------------------------------
+
+class TestTrayMenu:
+  def _make_app(self, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
+    config = dict(main.DEFAULT_CONFIG)
+    config["save_folder"] = str(tmp_path)
+    main.save_config(config)
+    ip = ImmediPaste()
+    ip.app = QApplication.instance()
+    ip.tray_menu = QMenu()
+    ip._build_tray_menu()
+    return ip
+
+  def _labels(self, ip):
+    return [a.text() for a in ip.tray_menu.actions() if not a.isSeparator()]
+
+  def test_static_menu_layout(self, tmp_path, monkeypatch):
+    ip = self._make_app(tmp_path, monkeypatch)
+    assert self._labels(ip)[0] == "Capture Region  (Ctrl + Alt + Shift + S)"
+    assert self._labels(ip)[-2:] == ["Settings", "Exit"]
+    assert not ip._history_separator.isVisible()
+
+  def test_capture_adds_history_entry_in_place(self, tmp_path, monkeypatch):
+    ip = self._make_app(tmp_path, monkeypatch)
+    ip.tray_icon = MagicMock()
+    static = [ip._region_action, ip._settings_separator]
+    for i in range(main.MAX_HISTORY + 2):
+      ip._on_capture_done(str(tmp_path / ("shot_%d.png" % i)))
+    labels = self._labels(ip)
+    assert labels[3] == "shot_%d.png" % (main.MAX_HISTORY + 1)
+    assert len(ip._history_actions) == main.MAX_HISTORY
+    assert len(labels) == 5 + main.MAX_HISTORY
+    assert all(a in ip.tray_menu.actions() for a in static)
+    assert ip._history_separator.isVisible()
+
+  def test_history_click_opens_path(self, tmp_path, monkeypatch):
+    ip = self._make_app(tmp_path, monkeypatch)
+    ip.tray_icon = MagicMock()
+    path = str(tmp_path / "a.png")
+    ip._on_capture_done(path)
+    with patch.object(ImmediPaste, "_show_in_explorer") as mock_show:
+      ip._history_actions[0].trigger()
+      ip._settings_separator.trigger()
+    mock_show.assert_called_once_with(path)
+
+  def test_hotkey_change_updates_label(self, tmp_path, monkeypatch):
+    ip = self._make_app(tmp_path, monkeypatch)
+    ip._apply_settings({"hotkey_window": "<ctrl>+<alt>+w"})
+    assert ip._window_action.text() == "Capture Window  (Ctrl + Alt + W)"
+
+
 # -- Config migration -------------------------------------------------------
 
 class TestConfigMigration:
@@ -296,11 +336,10 @@ class TestConfigMigration:
     assert v4_config["filename_suffix"] == "%Y-%m-%d_%H-%M-%S"
     assert v4_config["config_version"] == CONFIG_VERSION
 
-  def test_load_triggers_migration(self, tmp_path, monkeypatch):
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
+  def test_load_triggers_migration(self, config_file):
     # Write a v1 config missing new keys
     old = {"save_folder": "~/Desktop", "format": "jpg", "filename_prefix": "shot"}
-    (tmp_path / "config.json").write_text(json.dumps(old))
+    config_file.write_text(json.dumps(old))
 
     config = main.load_config()
     assert config["config_version"] == CONFIG_VERSION
@@ -308,5 +347,5 @@ class TestConfigMigration:
     assert config["save_folder"] == "~/Desktop"  # preserved
 
     # File should have been updated on disk
-    on_disk = json.loads((tmp_path / "config.json").read_text())
+    on_disk = json.loads(config_file.read_text())
     assert on_disk["config_version"] == CONFIG_VERSION
@@ -33,6 +33,27 @@ class TestGetLogger:
     handler_count = len(logger.handlers)
     assert handler_count <= 2  # file + console at most
 
+  def test_records_written_off_calling_thread(self):
+    import threading
+    from log import _listener
+    seen = []
+
+    class Recorder(logging.Handler):
+      def emit(self, record):
+        seen.append((record.getMessage(), threading.current_thread()))
+
+    recorder = Recorder()
+    _listener.handlers = _listener.handlers + (recorder,)
+    try:
+      get_logger("queued").warning("hello %s", "queue")
+      _listener.stop()
+      _listener.start()
+    finally:
+      _listener.handlers = tuple(h for h in _listener.handlers if h is not recorder)
+    assert seen
+    assert seen[0][0] == "hello queue"
+    assert seen[0][1] is not threading.current_thread()
+
   def test_log_path_is_string(self):
     assert isinstance(LOG_PATH, str)
     assert LOG_PATH.endswith("immedipaste.log")
@@ -43,3 +64,10 @@ class TestResolveLogDir:
     log_dir = _resolve_log_dir()
     assert os.path.isdir(log_dir)
     assert os.access(log_dir, os.W_OK)
+
+  def test_env_override_wins(self, tmp_path, monkeypatch):
+    from log import LOG_DIR_ENV
+    target = tmp_path / "logs"
+    monkeypatch.setenv(LOG_DIR_ENV, str(target))
+    assert _resolve_log_dir() == str(target)
+    assert target.is_dir()
@@ -3,12 +3,15 @@
 import platform
 from unittest.mock import patch
 
-from PySide6.QtGui import QImage, QColor
-from PySide6.QtWidgets import QApplication
+import pytest
 
-app = QApplication.instance() or QApplication([])
+from PySide6.QtGui import QImage, QColor
 
-from platform_utils import copy_image_to_clipboard, default_save_folder
+import platform_utils
+from platform_utils import (
+  IS_WINDOWS, MOD_ALT, MOD_CONTROL, MOD_SHIFT, MOD_WIN,
+  copy_image_to_clipboard, default_save_folder, parse_native_hotkey,
+)
 
 
 class TestCopyImageToClipboard:
@@ -32,3 +35,31 @@ class TestDefaultSaveFolder:
   def test_starts_with_tilde(self):
     folder = default_save_folder()
     assert folder.startswith("~")
+
+
+class TestParseNativeHotkey:
+  def test_default_hotkey(self):
+    assert parse_native_hotkey("<ctrl>+<alt>+<shift>+s") == (
+      MOD_CONTROL | MOD_ALT | MOD_SHIFT, ord("S"),
+    )
+
+  def test_special_and_function_keys(self):
+    assert parse_native_hotkey("<cmd>+<f5>") == (MOD_WIN, 0x74)
+    assert parse_native_hotkey("<ctrl>+<page_up>") == (MOD_CONTROL, 0x21)
+    assert parse_native_hotkey("<alt>+7") == (MOD_ALT, ord("7"))
+
+  def test_unsupported_returns_none(self):
+    assert parse_native_hotkey("s") is None  # no modifier
+    assert parse_native_hotkey("<ctrl>+<alt>") is None  # no key
+    assert parse_native_hotkey("<ctrl>+a+b") is None  # two keys
+    assert parse_native_hotkey("<ctrl>+;") is None  # punctuation
+
+
+@pytest.mark.skipif(not IS_WINDOWS, reason="RegisterHotKey is Windows-only")
+class TestNativeHotkeyListener:
+  def test_start_raises_when_thread_fails(self):
+    listener = platform_utils.NativeHotkeyListener([(MOD_CONTROL, ord("S"), lambda: None)])
+    with patch.object(platform_utils._user32, "RegisterHotKey",
+                      side_effect=TypeError("bad argument")):
+      with pytest.raises(OSError, match="bad argument"):
+        listener.start(timeout=5)
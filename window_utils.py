@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-import platform
-
 from log import get_logger
+from platform_utils import IS_WINDOWS
 
 log = get_logger("window")
-SYSTEM = platform.system()
 
-if SYSTEM == "Windows":
+if IS_WINDOWS:
   import ctypes
   import ctypes.wintypes
+  import threading
 
   user32 = ctypes.windll.user32
   dwmapi = ctypes.windll.dwmapi
@@ -48,10 +47,16 @@ if SYSTEM == "Windows":
   ]
   dwmapi.DwmGetWindowAttribute.restype = ctypes.c_long
 
+  # Bound once so the per-window EnumWindows callback skips the DLL lookups
+  _IsWindowVisible = user32.IsWindowVisible
+  _GetWindowLongW = user32.GetWindowLongW
+  _GetWindowRect = user32.GetWindowRect
+  _DwmGetWindowAttribute = dwmapi.DwmGetWindowAttribute
+
   def _is_cloaked(hwnd: ctypes.wintypes.HWND) -> bool:
     """Check if a window is cloaked (hidden UWP/Store app)."""
     cloaked = ctypes.c_int(0)
-    hr = dwmapi.DwmGetWindowAttribute(
+    hr = _DwmGetWindowAttribute(
       hwnd, DWMWA_CLOAKED,
       ctypes.byref(cloaked), ctypes.sizeof(cloaked),
     )
@@ -67,66 +72,93 @@ if SYSTEM == "Windows":
       log.warning("GetCursorPos failed: %s", e)
       return (0, 0)
 
-  def get_window_rect_at(x: int, y: int, exclude_hwnd: int = 0) -> tuple[int, int, int, int] | None:
-    """Return (left, top, right, bottom) for the topmost window at (x, y).
+  # Per-enumeration state for _enum_callback. EnumWindows has no closure
+  # argument worth using from Python, so the state lives here; thread-local
+  # in case two threads ever enumerate at once.
+  _enum = threading.local()
 
-    Enumerates all top-level windows in Z-order, skipping the excluded
-    overlay HWND, desktop, shell, cloaked, transparent, and invisible windows.
-    Returns None if no suitable window found.
-    """
-    result = [None]
-    desktop = int(user32.GetDesktopWindow() or 0)
-    shell = int(user32.GetShellWindow() or 0)
-    exclude = int(exclude_hwnd) if exclude_hwnd else 0
+  @WNDENUMPROC
+  def _enum_callback(hwnd, lparam):
+    """EnumWindows callback: append the bounds of each candidate window to _enum.rects.
 
-    @WNDENUMPROC
-    def callback(hwnd, lparam):
-      h = int(hwnd) if hwnd else 0
+    Created once at import so each enumeration reuses the same ctypes
+    trampoline instead of allocating a new one.
+    """
+    st = _enum
+    if (int(hwnd) if hwnd else 0) in st.skip:
+      return True
+    if not _IsWindowVisible(hwnd):
+      return True
 
-      if exclude and h == exclude:
-        return True
-      if h in (desktop, shell):
-        return True
-      if not user32.IsWindowVisible(hwnd):
-        return True
-      if _is_cloaked(hwnd):
-        return True
+    # Skip click-through windows (invisible overlays from other apps)
+    if _GetWindowLongW(hwnd, GWL_EXSTYLE) & WS_EX_TRANSPARENT:
+      return True
+    if _is_cloaked(hwnd):
+      return True
 
-      # Skip click-through windows (invisible overlays from other apps)
-      exstyle = user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
-      if exstyle & WS_EX_TRANSPARENT:
+    # Get tight window bounds (no invisible resize borders), falling back
+    # to the full window rect
+    rect = st.frame
+    hr = _DwmGetWindowAttribute(
+      hwnd, DWMWA_EXTENDED_FRAME_BOUNDS, st.frame_ref, ctypes.sizeof(rect),
+    )
+    if hr != 0:
+      rect = st.win
+      if not _GetWindowRect(hwnd, st.win_ref):
         return True
 
-      # Get tight window bounds (no invisible resize borders)
-      rect = ctypes.wintypes.RECT()
-      hr = dwmapi.DwmGetWindowAttribute(
-        hwnd, DWMWA_EXTENDED_FRAME_BOUNDS,
-        ctypes.byref(rect), ctypes.sizeof(rect),
-      )
-      if hr != 0:
-        user32.GetWindowRect(hwnd, ctypes.byref(rect))
+    if rect.right - rect.left < 1 or rect.bottom - rect.top < 1:
+      return True
 
-      if rect.right - rect.left < 1 or rect.bottom - rect.top < 1:
-        return True
+    st.rects.append((rect.left, rect.top, rect.right, rect.bottom))
+    return True
 
-      if rect.left <= x < rect.right and rect.top <= y < rect.bottom:
-        result[0] = (rect.left, rect.top, rect.right, rect.bottom)
-        return False  # Found topmost window, stop enumeration
+  def get_window_rects(exclude_hwnd: int = 0) -> list[tuple[int, int, int, int]]:
+    """Return (left, top, right, bottom) for every candidate window, topmost first.
 
-      return True
+    Enumerates all top-level windows in Z-order, skipping the excluded
+    overlay HWND, desktop, shell, cloaked, transparent, and invisible windows.
+    Hit-test the result with window_rect_at() to look up many points against
+    one enumeration.
+    """
+    st = _enum
+    if not hasattr(st, "win"):
+      st.win = ctypes.wintypes.RECT()
+      st.frame = ctypes.wintypes.RECT()
+      st.win_ref = ctypes.byref(st.win)
+      st.frame_ref = ctypes.byref(st.frame)
+    st.skip = frozenset((
+      int(user32.GetDesktopWindow() or 0),
+      int(user32.GetShellWindow() or 0),
+      int(exclude_hwnd) if exclude_hwnd else 0,
+    ))
+    rects: list[tuple[int, int, int, int]] = []
+    st.rects = rects
 
     try:
-      user32.EnumWindows(callback, 0)
+      user32.EnumWindows(_enum_callback, 0)
     except OSError as e:
       log.warning("EnumWindows failed: %s", e)
-      return None
-    return result[0]
+      return []
+    finally:
+      st.rects = None
+    return rects
 
 else:
   def get_cursor_pos() -> tuple[int, int]:
     """Cursor position not available on this platform."""
     return (0, 0)
 
-  def get_window_rect_at(x: int, y: int, exclude_hwnd: int = 0) -> tuple[int, int, int, int] | None:
+  def get_window_rects(exclude_hwnd: int = 0) -> list[tuple[int, int, int, int]]:
     """Window detection not available on this platform."""
-    return None
+    return []
+
+
+def window_rect_at(rects: list[tuple[int, int, int, int]],
+                   x: int, y: int) -> tuple[int, int, int, int] | None:
+  """Return the first (topmost) rect from get_window_rects() containing (x, y)."""
+  for rect in rects:
+    left, top, right, bottom = rect
+    if left <= x < right and top <= y < bottom:
+      return rect
+  return None